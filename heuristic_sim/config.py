@@ -26,7 +26,7 @@ def mask_to_columns(mask: int) -> list[int]:
 
 
 def popcount(mask: int) -> int:
-    return bin(mask).count("1")
+    return mask.bit_count()
 
 
 class Role(Enum):
@@ -5,11 +5,15 @@ from dataclasses import dataclass
 from sparse_blobpool.core.events import Command
 
 
-@dataclass
+@dataclass(slots=True)
 class InjectNext(Command):
     """Trigger next poison tx injection in a nonce chain."""
 
 
-@dataclass
+@dataclass(slots=True)
 class SpamNext(Command):
     """Trigger next spam tx injection."""
+
+
+INJECT_NEXT = InjectNext()
+SPAM_NEXT = SpamNext()
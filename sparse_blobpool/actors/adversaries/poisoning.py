@@ -7,9 +7,9 @@ from hashlib import sha256
 from typing import TYPE_CHECKING
 
 from sparse_blobpool.actors.adversaries.base import Adversary, AttackConfig
-from sparse_blobpool.actors.adversaries.commands import InjectNext
+from sparse_blobpool.actors.adversaries.commands import INJECT_NEXT, InjectNext
 from sparse_blobpool.core.types import Address, TxHash
-from sparse_blobpool.protocol.constants import ALL_ONES
+from sparse_blobpool.protocol.constants import ALL_ONES, BLOB_TX_SIZES, BLOB_TX_TYPES
 from sparse_blobpool.protocol.messages import NewPooledTransactionHashes
 
 if TYPE_CHECKING:
@@ -53,6 +53,7 @@ class TargetedPoisoningAdversary(Adversary):
         self._poisoning_config = attack_config
         self._current_nonce = 0
         self._sender = attack_config.sender_address or Address(f"0xadversary_{actor_id}")
+        self._hash_prefix = f"poison:{actor_id}:{self._sender}:".encode()
 
     @property
     def victim_id(self) -> ActorId | None:
@@ -74,9 +75,9 @@ class TargetedPoisoningAdversary(Adversary):
         tx_hash = self._create_poison_tx()
 
         announcement = NewPooledTransactionHashes(
-            sender=self.id,
-            types=bytes([3]),  # Blob tx type
-            sizes=[131072],
+            sender=self._id,
+            types=BLOB_TX_TYPES,
+            sizes=BLOB_TX_SIZES,
             hashes=[tx_hash],
             cell_mask=ALL_ONES,  # Claim to be provider
         )
@@ -87,10 +88,7 @@ class TargetedPoisoningAdversary(Adversary):
         self._current_nonce += 1
 
         if self._current_nonce < self._poisoning_config.nonce_chain_length:
-            self.schedule_command(
-                self._poisoning_config.injection_interval,
-                InjectNext(),
-            )
+            self.schedule_command(self._poisoning_config.injection_interval, INJECT_NEXT)
 
     def _on_command(self, cmd: Command) -> None:
         match cmd:
@@ -98,7 +96,7 @@ class TargetedPoisoningAdversary(Adversary):
                 self._inject_next_tx()
 
     def _create_poison_tx(self) -> TxHash:
-        data = f"poison:{self.id}:{self._sender}:{self._current_nonce}".encode()
+        data = self._hash_prefix + str(self._current_nonce).encode()
         return TxHash(sha256(data).hexdigest())
 
     def get_attack_progress(self) -> dict[str, int | float]:
@@ -7,14 +7,14 @@ from hashlib import sha256
 from typing import TYPE_CHECKING
 
 from sparse_blobpool.actors.adversaries.base import Adversary, AttackConfig
-from sparse_blobpool.actors.adversaries.commands import SpamNext
+from sparse_blobpool.actors.adversaries.commands import SPAM_NEXT, SpamNext
 from sparse_blobpool.actors.adversaries.victim_selection import (
     VictimSelectionConfig,
     VictimSelectionStrategy,
     VictimSelector,
 )
 from sparse_blobpool.core.types import TxHash
-from sparse_blobpool.protocol.constants import ALL_ONES
+from sparse_blobpool.protocol.constants import ALL_ONES, BLOB_TX_SIZES, BLOB_TX_TYPES
 from sparse_blobpool.protocol.messages import NewPooledTransactionHashes
 
 if TYPE_CHECKING:
@@ -51,6 +51,9 @@ class SpamAdversary(Adversary):
         self._spam_config = attack_config
         self._all_nodes = all_nodes
         self._spam_counter = 0
+        self._cell_mask = ALL_ONES if self._spam_config.valid_headers else 0
+        # Hash state over the constant prefix; each tx hash only absorbs the counter
+        self._hash_prefix = sha256(f"spam:{actor_id}:".encode())
 
         # Initialize victim selector
         victim_config = attack_config.victim_selection_config or VictimSelectionConfig(
@@ -72,7 +75,7 @@ class SpamAdversary(Adversary):
             return
 
         delay = 1.0 / self._spam_config.spam_rate
-        self.schedule_command(delay, SpamNext())
+        self.schedule_command(delay, SPAM_NEXT)
 
     def _on_command(self, cmd: Command) -> None:
         match cmd:
@@ -84,27 +87,26 @@ class SpamAdversary(Adversary):
         tx_hash = self._generate_spam_tx_hash()
         self._spam_counter += 1
 
-        cell_mask = ALL_ONES if self._spam_config.valid_headers else 0
         announcement = NewPooledTransactionHashes(
-            sender=self.id,
-            types=bytes([3]),  # Blob tx type
-            sizes=[131072],  # ~128 KB tx size
+            sender=self._id,
+            types=BLOB_TX_TYPES,
+            sizes=BLOB_TX_SIZES,
             hashes=[tx_hash],
-            cell_mask=cell_mask,
+            cell_mask=self._cell_mask,
         )
 
         # Use victim selector to determine targets
         targets = self._victim_selector.get_victims()
-        for target in targets:
-            self.send(announcement, to=target)
+        self.send_many(announcement, to=targets)
 
         # Record spam sent to victims in metrics
         for victim_id in targets:
             self.simulator.metrics.record_victim_targeted(victim_id, "spam", tx_hash)
 
     def _generate_spam_tx_hash(self) -> TxHash:
-        data = f"spam:{self.id}:{self._spam_counter}".encode()
-        return TxHash(sha256(data).hexdigest())
+        h = self._hash_prefix.copy()
+        h.update(str(self._spam_counter).encode())
+        return TxHash(h.hexdigest())
 
     @property
     def victims(self) -> list[ActorId]:
@@ -77,7 +77,7 @@ class VictimSelector:
         if self.config.explicit_victims is not None:
             victims = list(self.config.explicit_victims)
             if self.config.exclude_controlled:
-                victims = [n for n in victims if n not in self.controlled_nodes]
+                victims = self._without_controlled(victims)
             self._selected_victims = victims
             return self._selected_victims
 
@@ -87,7 +87,7 @@ class VictimSelector:
         # Filter candidates
         candidates = self.all_nodes
         if self.config.exclude_controlled:
-            candidates = [n for n in candidates if n not in self.controlled_nodes]
+            candidates = self._without_controlled(candidates)
 
         # Ensure we don't select more than available
         num_victims = min(num_victims, len(candidates))
@@ -142,14 +142,14 @@ class VictimSelector:
         if self.config.explicit_victims is not None:
             victims = list(self.config.explicit_victims)
             if self.config.exclude_controlled:
-                victims = [n for n in victims if n not in self.controlled_nodes]
+                victims = self._without_controlled(victims)
             return victims
 
         num_victims = self._determine_count(count=count)
 
         candidates = self.all_nodes
         if self.config.exclude_controlled:
-            candidates = [n for n in candidates if n not in self.controlled_nodes]
+            candidates = self._without_controlled(candidates)
 
         num_victims = min(num_victims, len(candidates))
 
@@ -173,6 +173,10 @@ class VictimSelector:
             case _:
                 return self._select_random(candidates, num_victims)
 
+    def _without_controlled(self, nodes: list[ActorId]) -> list[ActorId]:
+        controlled = frozenset(self.controlled_nodes)
+        return [n for n in nodes if n not in controlled]
+
     def _determine_count(self, count: int | None = None) -> int:
         if self.config.explicit_victims is not None:
             return len(self.config.explicit_victims)
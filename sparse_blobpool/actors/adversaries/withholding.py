@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from sparse_blobpool.actors.adversaries.base import Adversary, AttackConfig
+from sparse_blobpool.protocol.constants import ALL_ONES, columns_to_mask
 from sparse_blobpool.protocol.messages import Cells, GetCells
 
 if TYPE_CHECKING:
@@ -41,12 +42,10 @@ class WithholdingAdversary(Adversary):
         super().__init__(actor_id, simulator, controlled_nodes, attack_config)
         self._withholding_config = attack_config
         self._allowed_mask = self._compute_allowed_mask()
+        self._disallowed_mask = ALL_ONES & ~self._allowed_mask
 
     def _compute_allowed_mask(self) -> int:
-        mask = 0
-        for col in self._withholding_config.columns_to_serve:
-            mask |= 1 << col
-        return mask
+        return columns_to_mask(self._withholding_config.columns_to_serve)
 
     def execute(self) -> None:
         self._attack_started = True
@@ -57,8 +56,16 @@ class WithholdingAdversary(Adversary):
                 self._handle_get_cells(req)
 
     def _handle_get_cells(self, req: GetCells) -> None:
-        allowed = req.cell_mask & self._allowed_mask
-        if allowed != req.cell_mask:
+        # Outside the attack window, serve everything requested
+        if not self._attack_started or self._attack_stopped:
+            self._serve_cells(req, req.cell_mask)
+            return
+
+        allowed = req.cell_mask
+        withheld = allowed & self._disallowed_mask
+        if withheld:
+            allowed ^= withheld
+
             if self._withholding_config.delay_other_columns is not None:
                 # Delay response for non-served columns
                 pass
@@ -67,18 +74,17 @@ class WithholdingAdversary(Adversary):
                 pass
 
         if allowed:
-            response = Cells(
-                sender=self.id,
-                tx_hashes=req.tx_hashes,
-                cells=[[] for _ in req.tx_hashes],  # Simplified - no actual cell data
-                cell_mask=allowed,
-            )
-            self.send(response, to=req.sender)
-
-    def get_withheld_columns(self, request_mask: int) -> set[int]:
-        withheld = request_mask & ~self._allowed_mask
-        columns = set()
-        for i in range(128):
-            if withheld & (1 << i):
-                columns.add(i)
-        return columns
+            self._serve_cells(req, allowed)
+
+    def _serve_cells(self, req: GetCells, cell_mask: int) -> None:
+        response = Cells(
+            sender=self._id,
+            tx_hashes=req.tx_hashes,
+            cells=((),) * len(req.tx_hashes),  # Simplified - no actual cell data
+            cell_mask=cell_mask,
+        )
+        self.send(response, to=req.sender)
+
+    def get_withheld_columns(self, request_mask: int) -> int:
+        """Return the mask of requested columns this adversary would not serve."""
+        return request_mask & self._disallowed_mask
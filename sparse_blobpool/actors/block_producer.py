@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from sparse_blobpool.config import SimulationConfig
 from sparse_blobpool.core.actor import Actor, EventPayload
 from sparse_blobpool.core.types import ActorId
-from sparse_blobpool.protocol.commands import ProduceBlock, SlotTick
+from sparse_blobpool.protocol.commands import SLOT_TICK, ProduceBlock, SlotTick
 
 if TYPE_CHECKING:
     from sparse_blobpool.actors.honest import Node
@@ -32,7 +32,7 @@ class BlockProducer(Actor):
         return self._current_slot
 
     def start(self) -> None:
-        self.schedule_command(self._config.slot_duration, SlotTick())
+        self.schedule_command(self._config.slot_duration, SLOT_TICK)
 
     def on_event(self, payload: EventPayload) -> None:
         match payload:
@@ -50,9 +50,16 @@ class BlockProducer(Actor):
 
         self._advance_slot()
 
+    def preview_proposers(self, count: int) -> list[ActorId]:
+        """Return the ids of the next count proposers without running any slots."""
+        nodes = self._simulator.nodes
+        if not nodes:
+            return []
+        return [nodes[(self._current_slot + i) % len(nodes)].id for i in range(count)]
+
     def _select_proposer(self, nodes: list[Node]) -> Node:
         return nodes[self._current_slot % len(nodes)]
 
     def _advance_slot(self) -> None:
         self._current_slot += 1
-        self.schedule_command(self._config.slot_duration, SlotTick())
+        self.schedule_command(self._config.slot_duration, SLOT_TICK)
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 from sparse_blobpool.config import InclusionPolicy
 from sparse_blobpool.core.actor import Actor, EventPayload, Message
+from sparse_blobpool.core.types import Address
 from sparse_blobpool.pool.blobpool import (
     Blobpool,
     BlobTxEntry,
@@ -23,10 +24,11 @@ from sparse_blobpool.protocol.commands import (
     RequestTimeout,
     TxCleanup,
 )
-from sparse_blobpool.protocol.constants import ALL_ONES
+from sparse_blobpool.protocol.constants import ALL_ONES, BLOB_TX_TYPES, CELL_SIZE
 from sparse_blobpool.protocol.messages import (
     Block,
     BlockBroadcast,
+    Cell,
     Cells,
     GetCells,
     GetPooledTransactions,
@@ -35,11 +37,17 @@ from sparse_blobpool.protocol.messages import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sparse_blobpool.config import SimulationConfig
+    from sparse_blobpool.core.events import Event
     from sparse_blobpool.core.simulator import Simulator
     from sparse_blobpool.core.types import ActorId, RequestId, TxHash
     from sparse_blobpool.metrics.collector import MetricsCollector
 
+CLEANUP_DELAY = 2.0  # Seconds an included tx stays pooled, to allow block propagation
+_PLACEHOLDER_CELL = Cell(data=bytes(CELL_SIZE), proof=bytes(48))
+
 
 class Role(Enum):
     """Node's role for a specific transaction."""
@@ -78,6 +86,7 @@ class PendingRequest:
     target_peer: ActorId
     request_type: str  # "tx" or "cells"
     sent_at: float
+    timeout: Event | None = None  # Canceled once the response arrives
 
 
 class Node(Actor):
@@ -104,6 +113,8 @@ class Node(Actor):
 
         # Peer connections
         self._peers: set[ActorId] = set()
+        # Sorted snapshot of _peers for deterministic fan-out, rebuilt lazily on change
+        self._peer_order: tuple[ActorId, ...] | None = None
 
         # Transaction processing state
         self._pending_txs: dict[TxHash, PendingTx] = {}
@@ -127,9 +138,21 @@ class Node(Actor):
 
     def add_peer(self, peer_id: ActorId) -> None:
         self._peers.add(peer_id)
+        self._peer_order = None
+
+    def add_peers(self, peer_ids: Iterable[ActorId]) -> None:
+        self._peers.update(peer_ids)
+        self._peer_order = None
 
     def remove_peer(self, peer_id: ActorId) -> None:
         self._peers.discard(peer_id)
+        self._peer_order = None
+
+    def _sorted_peers(self) -> tuple[ActorId, ...]:
+        peer_order = self._peer_order
+        if peer_order is None:
+            peer_order = self._peer_order = tuple(sorted(self._peers))
+        return peer_order
 
     def on_event(self, payload: EventPayload) -> None:
         match payload:
@@ -213,8 +236,7 @@ class Node(Actor):
 
         columns = set[int]()
         while len(columns) < self._custody_columns:
-            col = rng.randint(0, 127)
-            columns.add(col)
+            columns.add(rng.randrange(128))
 
         mask = 0
         for col in columns:
@@ -357,10 +379,7 @@ class Node(Actor):
             if pending is None:
                 continue
 
-            # Clear pending request
-            if pending.pending_request_id is not None:
-                self._pending_requests.pop(pending.pending_request_id, None)
-                pending.pending_request_id = None
+            self._clear_pending_request(pending)
 
             pending.tx_body_received = True
 
@@ -430,9 +449,8 @@ class Node(Actor):
         return extra_mask
 
     def _handle_get_cells(self, msg: GetCells) -> None:
-        from sparse_blobpool.protocol.messages import Cell, Cells
-
         cells_response: list[list[Cell | None]] = []
+        provided_mask = 0
 
         for tx_hash in msg.tx_hashes:
             entry = self._pool.get(tx_hash)
@@ -442,24 +460,19 @@ class Node(Actor):
 
             # Return cells we have that match the request mask
             available_mask = entry.cell_mask & msg.cell_mask
+            provided_mask |= available_mask
             tx_cells: list[Cell | None] = []
 
-            for col in range(128):
-                if available_mask & (1 << col):
-                    # We have this cell - create dummy cell data
-                    tx_cells.append(Cell(data=b"\x00" * 2048, proof=b"\x00" * 48))
-                elif msg.cell_mask & (1 << col):
-                    tx_cells.append(None)  # Requested but we don't have it
+            # Walk only the requested columns, lowest first
+            remaining = msg.cell_mask
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                # Cell payloads are never inspected, so all present cells share one placeholder
+                tx_cells.append(_PLACEHOLDER_CELL if available_mask & bit else None)
 
             cells_response.append(tx_cells)
 
-        # Compute actual mask of what we're providing
-        provided_mask = 0
-        for tx_hash, _entry_cells in zip(msg.tx_hashes, cells_response, strict=False):
-            entry = self._pool.get(tx_hash)
-            if entry:
-                provided_mask |= entry.cell_mask & msg.cell_mask
-
         response = Cells(
             sender=self._id,
             tx_hashes=msg.tx_hashes,
@@ -474,10 +487,7 @@ class Node(Actor):
             if pending is None:
                 continue
 
-            # Clear pending request
-            if pending.pending_request_id is not None:
-                self._pending_requests.pop(pending.pending_request_id, None)
-                pending.pending_request_id = None
+            self._clear_pending_request(pending)
 
             # Update received cells
             pending.cells_received |= msg.cell_mask
@@ -498,11 +508,9 @@ class Node(Actor):
 
         # Create pool entry (we don't have full tx metadata in this sim,
         # so we create a minimal entry)
-        from sparse_blobpool.core.types import Address
-
         entry = BlobTxEntry(
             tx_hash=tx_hash,
-            sender=Address(f"0x{tx_hash[:40]}"),  # Derive fake sender from hash
+            sender=Address("0x" + tx_hash[:40]),  # Derive fake sender from hash
             nonce=0,
             gas_fee_cap=1000000000,
             gas_tip_cap=100000000,
@@ -526,19 +534,18 @@ class Node(Actor):
             pass  # Transaction rejected
 
     def _announce_tx(self, entry: BlobTxEntry) -> None:
-        for peer in sorted(self._peers):
-            if peer in entry.announced_to:
-                continue
-
-            msg = NewPooledTransactionHashes(
-                sender=self._id,
-                types=bytes([3]),
-                sizes=[entry.tx_size],
-                hashes=[entry.tx_hash],
-                cell_mask=entry.cell_mask,
-            )
-            self.send(msg, peer)
-            entry.announced_to.add(peer)
+        # Every peer receives the same announcement, so build it once
+        msg = NewPooledTransactionHashes(
+            sender=self._id,
+            types=BLOB_TX_TYPES,
+            sizes=[entry.tx_size],
+            hashes=[entry.tx_hash],
+            cell_mask=entry.cell_mask,
+        )
+        announced_to = entry.announced_to
+        targets = [peer for peer in self._sorted_peers() if peer not in announced_to]
+        self.send_many(msg, targets)
+        announced_to.update(targets)
 
     def _allocate_request_id(self) -> RequestId:
         from sparse_blobpool.core.types import RequestId
@@ -548,11 +555,20 @@ class Node(Actor):
         return request_id
 
     def _schedule_request_timeout(self, request_id: RequestId) -> None:
-        self.schedule_command(
+        self._pending_requests[request_id].timeout = self.schedule_command(
             self._config.request_timeout,
             RequestTimeout(request_id=request_id),
         )
 
+    def _clear_pending_request(self, pending: PendingTx) -> None:
+        """Forget the in-flight request for a tx and cancel its timeout."""
+        if pending.pending_request_id is None:
+            return
+        request = self._pending_requests.pop(pending.pending_request_id, None)
+        pending.pending_request_id = None
+        if request is not None and request.timeout is not None:
+            self._simulator.cancel(request.timeout)
+
     def _schedule_provider_observation_timeout(self, tx_hash: TxHash) -> None:
         self.schedule_command(
             self._config.provider_observation_timeout,
@@ -649,9 +665,7 @@ class Node(Actor):
         return True
 
     def _schedule_tx_cleanup(self, tx_hash: TxHash) -> None:
-        # Delay cleanup slightly to allow block propagation
-        cleanup_delay = 2.0  # seconds
-        self.schedule_command(cleanup_delay, TxCleanup(tx_hash=tx_hash))
+        self.schedule_command(CLEANUP_DELAY, TxCleanup(tx_hash=tx_hash))
 
     def _handle_tx_cleanup(self, cmd: TxCleanup) -> None:
         self._pool.remove(cmd.tx_hash)
@@ -670,21 +684,21 @@ class Node(Actor):
 
         announcement = BlockBroadcast(sender=self._id, block=block)
 
-        for peer in sorted(self._peers):
-            self.send(announcement, peer)
+        self.send_many(announcement, self._sorted_peers())
 
         self._handle_block_announcement(announcement)
 
     def _select_blobs_for_block(self) -> list[BlobTxEntry]:
-        candidates = [tx for tx in self._pool.iter_by_priority() if self._is_includable(tx)]
-
+        max_blobs = self._config.max_blobs_per_block
         selected: list[BlobTxEntry] = []
         blob_count = 0
 
-        for tx in candidates:
-            if blob_count + tx.blob_count <= self._config.max_blobs_per_block:
+        for tx in self._pool.iter_top():
+            if blob_count + tx.blob_count <= max_blobs and self._is_includable(tx):
                 selected.append(tx)
                 blob_count += tx.blob_count
+                if blob_count >= max_blobs:
+                    break
 
         return selected
 
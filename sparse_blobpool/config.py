@@ -16,7 +16,7 @@ class InclusionPolicy(Enum):
     PROACTIVE = auto()  # Would trigger resampling first (not implemented)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Configuration for the sparse blobpool simulation."""
 
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from sparse_blobpool.core.events import Command, Event, EventPayload, Message
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sparse_blobpool.core.simulator import Simulator
     from sparse_blobpool.core.types import ActorId
 
@@ -23,6 +25,8 @@ class Actor(ABC):
     Network component.
     """
 
+    __slots__ = ("_id", "_simulator")
+
     def __init__(self, actor_id: ActorId, simulator: Simulator) -> None:
         self._id = actor_id
         self._simulator = simulator
@@ -44,13 +48,20 @@ class Actor(ABC):
         """Send a message to another actor via the network."""
         self._simulator.network.deliver(msg, self._id, to)
 
-    def schedule_command(self, delay: float, command: Command) -> None:
-        """Schedule a self-targeted command after a delay."""
-        self._simulator.schedule(
-            Event(
-                timestamp=self._simulator.current_time + delay,
-                priority=1,  # Commands have lower priority than messages
-                target_id=self._id,
-                payload=command,
-            )
+    def send_many(self, msg: Message, to: Iterable[ActorId]) -> None:
+        """Send the same message to several actors, in order, as one batch."""
+        self._simulator.network.deliver_many(msg, self._id, to)
+
+    def schedule_command(self, delay: float, command: Command) -> Event:
+        """Schedule a self-targeted command after a delay.
+
+        Returns the scheduled event so it can be canceled before it fires.
+        """
+        event = Event(
+            timestamp=self._simulator.current_time + delay,
+            priority=1,  # Commands have lower priority than messages
+            target_id=self._id,
+            payload=command,
         )
+        self._simulator.schedule(event)
+        return event
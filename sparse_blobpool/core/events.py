@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from sparse_blobpool.core.types import ActorId
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Base class for all protocol messages transmitted over the network."""
 
@@ -21,7 +21,7 @@ class Message:
         return 8  # Base overhead
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Base class for all local commands.
 
@@ -34,16 +34,19 @@ class Command:
 EventPayload = Message | Command
 
 
-@dataclass(order=True)
+@dataclass(eq=False, slots=True)
 class Event:
     """A scheduled event in the simulation.
 
-    Events are ordered by (timestamp, priority) for the priority queue.
-    Lower priority values are processed first when timestamps are equal.
+    The simulator processes events by (timestamp, priority), then in the order
+    they were scheduled. Lower priority values are processed first when
+    timestamps are equal.
     """
 
     timestamp: float
-    target_id: ActorId = field(compare=False)
-    payload: EventPayload = field(compare=False)
+    target_id: ActorId
+    payload: EventPayload
     priority: int = 0
-    sequence: int = 0
+    # Lifecycle flags owned by the simulator
+    canceled: bool = field(default=False, init=False)
+    fired: bool = field(default=False, init=False)
@@ -19,7 +19,7 @@ def _compute_jitter_ratio(base_ms: float) -> float:
         return 0.15
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LatencyParams:
     """Parameters for modeling network latency between countries."""
 
@@ -92,7 +92,7 @@ class CountryLatencyModel:
         return self._countries
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountryWeights:
     """Node distribution weights by country.
 
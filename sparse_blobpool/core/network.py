@@ -10,13 +10,18 @@ from sparse_blobpool.core.events import Event
 from sparse_blobpool.core.latency import LATENCY_MODEL, Country
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sparse_blobpool.core.events import Message
     from sparse_blobpool.core.simulator import Simulator
     from sparse_blobpool.core.types import ActorId
     from sparse_blobpool.metrics.collector import MetricsCollector
 
+# Country assumed for actors that were never registered with the network.
+DEFAULT_COUNTRY: Country = "united states"
+
 
-@dataclass
+@dataclass(slots=True)
 class CoDelState:
     """Per-node CoDel queue state for congestion modeling.
 
@@ -50,7 +55,7 @@ class CoDelState:
     last_drop_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CoDelConfig:
     """Configuration for CoDel queue modeling.
 
@@ -89,6 +94,15 @@ class Network:
         self._actor_countries: dict[ActorId, Country] = {}
         self._actor_bandwidth: dict[ActorId, float] = {}
 
+        # Country-pair latency tables indexed by small ints, filled in as
+        # countries are first seen. Index 0 is the fallback for unregistered
+        # actors.
+        self._country_index: dict[Country, int] = {}
+        self._actor_country_index: dict[ActorId, int] = {}
+        self._base_delay: list[list[float]] = []
+        self._jitter_stddev: list[list[float]] = []
+        self._index_country(DEFAULT_COUNTRY)
+
         # Per-node CoDel state
         self._codel_state_egress: dict[ActorId, CoDelState] = {}
         self._codel_state_ingress: dict[ActorId, CoDelState] = {}
@@ -104,8 +118,39 @@ class Network:
         bandwidth: float | None = None,
     ) -> None:
         self._actor_countries[actor_id] = country
+        self._actor_country_index[actor_id] = self._index_country(country)
         self._actor_bandwidth[actor_id] = bandwidth or self._default_bandwidth
 
+    def _index_country(self, country: Country) -> int:
+        """Return the table index for country, adding a row and column if new."""
+        index = self._country_index.get(country)
+        if index is not None:
+            return index
+
+        index = len(self._country_index)
+        self._country_index[country] = index
+        countries = list(self._country_index)
+
+        base_row: list[float] = []
+        jitter_row: list[float] = []
+        for other in countries:
+            params = LATENCY_MODEL.get_latency(country, other)
+            base = params.base_ms / 1000.0
+            base_row.append(base)
+            jitter_row.append(base * params.jitter_ratio)
+        self._base_delay.append(base_row)
+        self._jitter_stddev.append(jitter_row)
+
+        for other, base_col, jitter_col in zip(
+            countries[:-1], self._base_delay, self._jitter_stddev, strict=False
+        ):
+            params = LATENCY_MODEL.get_latency(other, country)
+            base = params.base_ms / 1000.0
+            base_col.append(base)
+            jitter_col.append(base * params.jitter_ratio)
+
+        return index
+
     def deliver(self, msg: Message, from_: ActorId, to: ActorId) -> None:
         """Schedule message delivery with calculated delay."""
         delay = self._calculate_delay(from_, to, msg.size_bytes)
@@ -126,6 +171,35 @@ class Network:
         is_control = self._is_control_message(msg)
         self._metrics.record_bandwidth(from_, to, msg.size_bytes, is_control)
 
+    def deliver_many(self, msg: Message, from_: ActorId, to: Iterable[ActorId]) -> None:
+        """Schedule delivery of one message to several recipients.
+
+        Equivalent to calling deliver() for each recipient in order, but the
+        resulting events are queued as a single batch.
+        """
+        recipients = list(to)
+        size_bytes = msg.size_bytes
+        now = self._simulator.current_time
+
+        self._simulator.schedule_many(
+            [
+                Event(
+                    timestamp=now + self._calculate_delay(from_, recipient, size_bytes),
+                    priority=0,
+                    target_id=recipient,
+                    payload=msg,
+                )
+                for recipient in recipients
+            ]
+        )
+
+        self._messages_delivered += len(recipients)
+        self._total_bytes += size_bytes * len(recipients)
+
+        is_control = self._is_control_message(msg)
+        for recipient in recipients:
+            self._metrics.record_bandwidth(from_, recipient, size_bytes, is_control)
+
     def _is_control_message(self, msg: Message) -> bool:
         from sparse_blobpool.protocol.messages import Cells, GetCells, PooledTransactions
 
@@ -135,18 +209,15 @@ class Network:
 
     def _calculate_delay(self, from_: ActorId, to: ActorId, size_bytes: int) -> float:
         """Delay = base latency + jitter + transmission time + CoDel queue delay."""
-        # Get countries (default to 'united states' if not registered)
-        from_country = self._actor_countries.get(from_, "united states")
-        to_country = self._actor_countries.get(to, "united states")
-
-        # Get latency parameters from country-based model
-        params = LATENCY_MODEL.get_latency(from_country, to_country)
+        # Country indices (unregistered actors fall back to DEFAULT_COUNTRY)
+        from_index = self._actor_country_index.get(from_, 0)
+        to_index = self._actor_country_index.get(to, 0)
 
-        # Base delay (convert ms to seconds)
-        base = params.base_ms / 1000.0
+        # Base delay in seconds, precomputed from the country-based model
+        base = self._base_delay[from_index][to_index]
 
         # Jitter (Gaussian, clamped to non-negative)
-        jitter = self._simulator.rng.gauss(0, base * params.jitter_ratio)
+        jitter = self._simulator.rng.gauss(0, self._jitter_stddev[from_index][to_index])
 
         # Transmission time
         from_bw = self._actor_bandwidth.get(from_, self._default_bandwidth)
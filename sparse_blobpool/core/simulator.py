@@ -3,40 +3,86 @@
 from __future__ import annotations
 
 import heapq
+from collections import deque
 from random import Random
 from typing import TYPE_CHECKING, TypeVar
 
 from sparse_blobpool.core.events import Event
+from sparse_blobpool.core.types import Address, TxHash
+from sparse_blobpool.protocol.commands import BroadcastTransaction
+from sparse_blobpool.protocol.constants import ALL_ONES
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from sparse_blobpool.actors.block_producer import BlockProducer
     from sparse_blobpool.actors.honest import Node
     from sparse_blobpool.config import SimulationConfig
     from sparse_blobpool.core.actor import Actor
+    from sparse_blobpool.core.events import EventPayload
     from sparse_blobpool.core.network import Network
     from sparse_blobpool.core.topology import Topology
-    from sparse_blobpool.core.types import ActorId, TxHash
+    from sparse_blobpool.core.types import ActorId
     from sparse_blobpool.metrics.collector import MetricsCollector
     from sparse_blobpool.metrics.results import SimulationResults
     from sparse_blobpool.protocol.commands import Command
 
 ActorT = TypeVar("ActorT", bound="Actor")
 
+# Heap entries lead with the ordering key so heapq compares plain tuples; the
+# unique scheduling sequence ends every tie, so the Event itself is never compared.
+type _QueueEntry = tuple[float, int, int, Event]
+
+
+def _random_tx_hashes(rng: Random, count: int) -> list[TxHash]:
+    """Draw count random transaction hashes from a single randbytes call.
+
+    One draw yields the same bytes as consecutive randbytes(32) calls, so the
+    hashes match those of drawing them one at a time.
+    """
+    hex_digits = rng.randbytes(32 * count).hex()
+    return [TxHash(hex_digits[i : i + 64]) for i in range(0, len(hex_digits), 64)]
+
+
+def _synthetic_tx(tx_hash: TxHash) -> BroadcastTransaction:
+    """Build the single-blob transaction injected by the broadcast helpers."""
+    return BroadcastTransaction(
+        tx_hash=tx_hash,
+        tx_sender=Address("0x" + tx_hash[:40]),
+        nonce=0,
+        gas_fee_cap=1000000000,
+        gas_tip_cap=100000000,
+        blob_gas_price=1000000,
+        tx_size=131072,
+        blob_count=1,
+        cell_mask=ALL_ONES,
+    )
+
 
 class Simulator:
     """Single-threaded, deterministic discrete event simulator.
 
     Uses a min-heap priority queue for event scheduling and processing.
     All randomness is derived from a seeded RNG for reproducibility.
+
+    Priority-0 events scheduled for the current instant skip the heap and wait
+    in a FIFO. Their sequence numbers only grow, so the FIFO stays sorted and
+    the run loops merge its head with the heap's to keep the exact same order.
     """
 
     def __init__(self, seed: int = 42) -> None:
         self._current_time: float = 0.0
-        self._event_queue: list[Event] = []
+        self._event_queue: list[_QueueEntry] = []
+        self._now_queue: deque[_QueueEntry] = deque()
         self._actors: dict[ActorId, Actor] = {}
+        # Bound on_event per actor, resolved once at registration for the run loops
+        self._event_handlers: dict[ActorId, Callable[[EventPayload], None]] = {}
+        # Actors bucketed under every class in their MRO, in registration order
+        self._actors_by_type: dict[type, list[Actor]] = {}
         self._rng = Random(seed)
         self._events_processed: int = 0
         self._next_event_sequence: int = 0
+        self._canceled_count: int = 0
 
         self._network: Network | None = None
         self._block_producer: BlockProducer | None = None
@@ -56,7 +102,7 @@ class Simulator:
         return self._actors
 
     def actors_by_type(self, actor_type: type[ActorT]) -> list[ActorT]:
-        return [actor for actor in self._actors.values() if isinstance(actor, actor_type)]
+        return list(self._actors_by_type.get(actor_type, ()))  # type: ignore[arg-type]
 
     @property
     def events_processed(self) -> int:
@@ -66,7 +112,7 @@ class Simulator:
     def nodes(self) -> list[Node]:
         from sparse_blobpool.actors.honest import Node
 
-        return [actor for actor in self._actors.values() if isinstance(actor, Node)]
+        return self.actors_by_type(Node)
 
     @property
     def network(self) -> Network:
@@ -99,15 +145,75 @@ class Simulator:
         if actor.id in self._actors:
             raise ValueError(f"Actor {actor.id} already registered")
         self._actors[actor.id] = actor
+        self._event_handlers[actor.id] = actor.on_event
+        for cls in type(actor).__mro__:
+            self._actors_by_type.setdefault(cls, []).append(actor)
 
     def schedule(self, event: Event) -> None:
         if event.timestamp < self._current_time:
             raise ValueError(
                 f"Cannot schedule event in the past: {event.timestamp} < {self._current_time}"
             )
-        event.sequence = self._next_event_sequence
-        self._next_event_sequence += 1
-        heapq.heappush(self._event_queue, event)
+        sequence = self._next_event_sequence
+        self._next_event_sequence = sequence + 1
+        entry = (event.timestamp, event.priority, sequence, event)
+        if event.priority == 0 and event.timestamp == self._current_time:
+            self._now_queue.append(entry)
+        else:
+            heapq.heappush(self._event_queue, entry)
+
+    def schedule_many(self, events: Iterable[Event]) -> None:
+        """Schedule a batch of events.
+
+        Batches that are large relative to the queue are merged with a single
+        heap rebuild; smaller ones are pushed individually, which is cheaper
+        than reheapifying a long queue. Events keep the relative order they are
+        given in when their timestamps and priorities tie, exactly as if
+        schedule() had been called for each.
+        """
+        batch = list(events)
+        for event in batch:
+            if event.timestamp < self._current_time:
+                raise ValueError(
+                    f"Cannot schedule event in the past: {event.timestamp} < {self._current_time}"
+                )
+        sequence = self._next_event_sequence
+        entries: list[_QueueEntry] = []
+        for event in batch:
+            entries.append((event.timestamp, event.priority, sequence, event))
+            sequence += 1
+        self._next_event_sequence = sequence
+
+        queue = self._event_queue
+        if len(entries) * 4 > len(queue):
+            queue.extend(entries)
+            heapq.heapify(queue)
+        else:
+            for entry in entries:
+                heapq.heappush(queue, entry)
+
+    def cancel(self, event: Event) -> None:
+        """Cancel a scheduled event that has not fired yet.
+
+        The event stays in the queue and is dropped when popped. Once canceled
+        events make up more than half of the queue, it is rebuilt without them.
+        Canceling an event that already fired or was already canceled is a no-op.
+        """
+        if event.canceled or event.fired:
+            return
+        event.canceled = True
+        self._canceled_count += 1
+
+        queue = self._event_queue
+        now_queue = self._now_queue
+        if self._canceled_count * 2 > len(queue) + len(now_queue):
+            # Compact in place so loops holding references keep seeing the live queues
+            queue[:] = [entry for entry in queue if not entry[3].canceled]
+            heapq.heapify(queue)
+            live_now = [entry for entry in now_queue if not entry[3].canceled]
+            now_queue.clear()
+            now_queue.extend(live_now)
+            self._canceled_count = 0
 
     def deliver_command(self, command: Command, target_id: ActorId) -> None:
         """Deliver a command immediately to a target actor."""
@@ -121,34 +227,90 @@ class Simulator:
         )
 
     def run(self, until: float) -> None:
-        while self._event_queue and self._current_time < until:
-            event = heapq.heappop(self._event_queue)
-
-            # Don't process events beyond our target time
-            if event.timestamp > until:
-                # Put it back and stop
-                heapq.heappush(self._event_queue, event)
+        # Hot loop: bind everything touched per event to locals up front
+        queue = self._event_queue
+        now_queue = self._now_queue
+        handlers = self._event_handlers
+        heappop = heapq.heappop
+        popleft = now_queue.popleft
+        while self._current_time < until:
+            # Now-queue entries sit at the current time, so only the heap head
+            # can be past until; peek at it rather than popping and pushing back
+            if now_queue and (not queue or now_queue[0] < queue[0]):
+                entry = popleft()
+            elif queue and queue[0][0] <= until:
+                entry = heappop(queue)
+            else:
                 break
-
-            self._current_time = event.timestamp
-            self._dispatch_event(event)
+            event = entry[3]
+            if event.canceled:
+                self._canceled_count -= 1
+                continue
+
+            event.fired = True
+            self._current_time = entry[0]
+            handler = handlers.get(event.target_id)
+            if handler is None:
+                raise RuntimeError(f"Event targeted unknown actor: {event.target_id}")
+            handler(event.payload)
             self._events_processed += 1
 
     def run_until_empty(self) -> None:
-        while self._event_queue:
-            event = heapq.heappop(self._event_queue)
-            self._current_time = event.timestamp
-            self._dispatch_event(event)
+        queue = self._event_queue
+        now_queue = self._now_queue
+        handlers = self._event_handlers
+        heappop = heapq.heappop
+        popleft = now_queue.popleft
+        while queue or now_queue:
+            if now_queue and (not queue or now_queue[0] < queue[0]):
+                entry = popleft()
+            else:
+                entry = heappop(queue)
+            event = entry[3]
+            if event.canceled:
+                self._canceled_count -= 1
+                continue
+            event.fired = True
+            self._current_time = entry[0]
+            handler = handlers.get(event.target_id)
+            if handler is None:
+                raise RuntimeError(f"Event targeted unknown actor: {event.target_id}")
+            handler(event.payload)
             self._events_processed += 1
 
-    def _dispatch_event(self, event: Event) -> None:
-        if event.target_id not in self._actors:
-            raise RuntimeError(f"Event targeted unknown actor: {event.target_id}")
-        actor = self._actors[event.target_id]
-        actor.on_event(event.payload)
+    def run_events(self, count: int) -> int:
+        """Process the next count live events, regardless of their timestamps.
+
+        Returns the number processed, which is below count only when the
+        queue runs dry first.
+        """
+        queue = self._event_queue
+        now_queue = self._now_queue
+        handlers = self._event_handlers
+        heappop = heapq.heappop
+        popleft = now_queue.popleft
+        processed = 0
+        while processed < count and (queue or now_queue):
+            if now_queue and (not queue or now_queue[0] < queue[0]):
+                entry = popleft()
+            else:
+                entry = heappop(queue)
+            event = entry[3]
+            if event.canceled:
+                self._canceled_count -= 1
+                continue
+            event.fired = True
+            self._current_time = entry[0]
+            handler = handlers.get(event.target_id)
+            if handler is None:
+                raise RuntimeError(f"Event targeted unknown actor: {event.target_id}")
+            handler(event.payload)
+            self._events_processed += 1
+            processed += 1
+        return processed
 
     def pending_event_count(self) -> int:
-        return len(self._event_queue)
+        return len(self._event_queue) + len(self._now_queue) - self._canceled_count
 
     @classmethod
     def build(cls, config: SimulationConfig | None = None) -> Simulator:
@@ -197,15 +359,14 @@ class Simulator:
             network.register_node(actor_id, country)
             metrics.register_node(actor_id, country, node.custody_mask)
 
-        node_lookup = {node.id: node for node in nodes}
-
+        # Group edges per node so each peer set is filled with one bulk update.
+        # Edge endpoints come from the same topology, so every id has an entry.
+        adjacency: dict[ActorId, list[ActorId]] = {node.id: [] for node in nodes}
         for node_a_id, node_b_id in topology.edges:
-            node_a = node_lookup.get(node_a_id)
-            node_b = node_lookup.get(node_b_id)
-
-            if node_a is not None and node_b is not None:
-                node_a.add_peer(node_b_id)
-                node_b.add_peer(node_a_id)
+            adjacency[node_a_id].append(node_b_id)
+            adjacency[node_b_id].append(node_a_id)
+        for node in nodes:
+            node.add_peers(adjacency[node.id])
 
         block_producer = BlockProducer(simulator=simulator, config=config)
         simulator.register_actor(block_producer)
@@ -223,30 +384,34 @@ class Simulator:
         tx_hash: TxHash | None = None,
     ) -> TxHash:
         """Broadcast a transaction into the network via a node."""
-        from sparse_blobpool.core.types import Address, TxHash
-        from sparse_blobpool.protocol.commands import BroadcastTransaction
-        from sparse_blobpool.protocol.constants import ALL_ONES
-
         if origin_node is None:
             origin_node = self.nodes[0]
 
         if tx_hash is None:
-            rand_bytes = self.rng.randbytes(32)
-            tx_hash = TxHash(rand_bytes.hex())
-
-        self.deliver_command(
-            BroadcastTransaction(
-                tx_hash=tx_hash,
-                tx_sender=Address(f"0x{tx_hash[:40]}"),
-                nonce=0,
-                gas_fee_cap=1000000000,
-                gas_tip_cap=100000000,
-                blob_gas_price=1000000,
-                tx_size=131072,
-                blob_count=1,
-                cell_mask=ALL_ONES,
-            ),
-            origin_node.id,
-        )
+            tx_hash = _random_tx_hashes(self._rng, 1)[0]
+
+        self.deliver_command(_synthetic_tx(tx_hash), origin_node.id)
 
         return tx_hash
+
+    def broadcast_transactions(self, origin_nodes: Sequence[Node]) -> list[TxHash]:
+        """Broadcast one random transaction from each origin node.
+
+        Equivalent to calling broadcast_transaction() per origin, but all
+        events are built first and merged into the queue in a single pass.
+        """
+        tx_hashes = _random_tx_hashes(self._rng, len(origin_nodes))
+
+        now = self._current_time
+        self.schedule_many(
+            [
+                Event(
+                    timestamp=now,
+                    priority=0,
+                    target_id=origin_node.id,
+                    payload=_synthetic_tx(tx_hash),
+                )
+                for origin_node, tx_hash in zip(origin_nodes, tx_hashes, strict=True)
+            ]
+        )
+        return tx_hashes
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from hashlib import sha256
 from typing import TYPE_CHECKING, NamedTuple
@@ -56,7 +57,8 @@ def _assign_countries(
 
     assignments: dict[ActorId, Country] = {}
     for i in range(node_count):
-        actor_id = ActorId(f"node-{i:04d}")
+        # Interned so ids rebuilt elsewhere from the same text share this object
+        actor_id = ActorId(sys.intern(f"node-{i:04d}"))
         r = rng.random()
         for threshold, country in cumulative:
             if r < threshold:
@@ -108,59 +110,46 @@ def geographic_policy(
 
     # Compute Kademlia IDs for bucket distribution
     kad_ids = [_kademlia_id(nid) for nid in node_ids]
+    node_countries = [assignments[nid] for nid in node_ids]
 
     # Group by country
     country_indices: dict[Country, list[int]] = {}
-    for i, nid in enumerate(node_ids):
-        country_indices.setdefault(assignments[nid], []).append(i)
+    for i, country in enumerate(node_countries):
+        country_indices.setdefault(country, []).append(i)
+
+    # Per source country, every other-country node ordered by (latency, index).
+    # This is the preference order for both bucket filling and phase 3.
+    by_latency: dict[Country, list[int]] = {}
+    for country in country_indices:
+        latency_to = {
+            other: LATENCY_MODEL.get_latency(country, other).base_ms for other in country_indices
+        }
+        by_latency[country] = sorted(
+            (j for j in range(n) if node_countries[j] != country),
+            key=lambda j: (latency_to[node_countries[j]], j),
+        )
 
     edges: set[tuple[ActorId, ActorId]] = set()
 
     for i, node_id in enumerate(node_ids):
         my_kad = kad_ids[i]
-        my_country = assignments[node_id]
-
-        # Calculate XOR distances with latency tiebreaker
-        distances: list[tuple[int, float, int]] = []
-        for j in range(n):
-            if j == i:
-                continue
-            xor_dist = my_kad ^ kad_ids[j]
-            other_country = assignments[node_ids[j]]
-            latency = LATENCY_MODEL.get_latency(my_country, other_country).base_ms
-            distances.append((xor_dist, latency, j))
-
-        distances.sort()
+        my_country = node_countries[i]
+        other_by_latency = by_latency[my_country]
 
         selected: set[int] = set()
-        buckets_filled: set[int] = set()
 
-        # Phase 1: Fill Kademlia buckets (prefer same country)
-        bucket_candidates: dict[int, list[tuple[float, int]]] = {}
-        for xor_dist, latency, j in distances:
-            bucket = xor_dist.bit_length() - 1 if xor_dist > 0 else 0
-            bucket_candidates.setdefault(bucket, []).append((latency, j))
+        # Phase 1: Fill Kademlia buckets (prefer same country). A bucket is the
+        # bit length of the XOR distance; each one contributes its lowest
+        # (latency, index) candidate. Iterating a preference order in reverse
+        # leaves the most preferred candidate per bucket in the dict.
+        buckets = [(my_kad ^ kad).bit_length() for kad in kad_ids]
+        best_same = {buckets[j]: j for j in reversed(country_indices[my_country]) if j != i}
+        best_other = {buckets[j]: j for j in reversed(other_by_latency)}
 
-        for bucket in sorted(bucket_candidates.keys()):
+        for bucket in sorted(best_same.keys() | best_other.keys()):
             if len(selected) >= mesh_degree:
                 break
-
-            candidates = bucket_candidates[bucket]
-            same_country = [
-                (lat, j) for lat, j in candidates if assignments[node_ids[j]] == my_country
-            ]
-            other_country = [
-                (lat, j) for lat, j in candidates if assignments[node_ids[j]] != my_country
-            ]
-
-            if same_country and bucket not in buckets_filled:
-                same_country.sort()
-                selected.add(same_country[0][1])
-                buckets_filled.add(bucket)
-            elif other_country and bucket not in buckets_filled:
-                other_country.sort()
-                selected.add(other_country[0][1])
-                buckets_filled.add(bucket)
+            selected.add(best_same[bucket] if bucket in best_same else best_other[bucket])
 
         # Phase 2: Fill with same-country peers
         same_country_candidates = [
@@ -175,17 +164,7 @@ def geographic_policy(
 
         # Phase 3: Cross-country by latency
         if len(selected) < mesh_degree:
-            other_candidates: list[tuple[float, int]] = []
-            for j in range(n):
-                if j == i or j in selected:
-                    continue
-                other_country = assignments[node_ids[j]]
-                if other_country != my_country:
-                    latency = LATENCY_MODEL.get_latency(my_country, other_country).base_ms
-                    other_candidates.append((latency, j))
-
-            other_candidates.sort()
-            for _, j in other_candidates:
+            for j in other_by_latency:
                 if len(selected) >= mesh_degree:
                     break
                 selected.add(j)
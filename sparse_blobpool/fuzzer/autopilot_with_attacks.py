@@ -123,9 +123,9 @@ def execute_scenario_with_attack(
     # Run the simulation
     try:
         # Broadcast transactions
+        nodes = sim.nodes
         for _ in range(num_transactions):
-            origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-            sim.broadcast_transaction(sim.nodes[origin_idx])
+            sim.broadcast_transaction(nodes[sim.rng.randrange(len(nodes))])
 
         sim.block_producer.start()
         sim.run(run_duration)
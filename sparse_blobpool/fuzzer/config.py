@@ -14,7 +14,7 @@ SLOTS_PER_EPOCH = 32
 DEFAULT_DURATION_SLOTS = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeTypeConfig:
     """Configuration for a node type with ranges for fuzzing.
 
@@ -73,7 +73,7 @@ DEFAULT_NODE_TYPES: list[NodeTypeConfig] = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterRanges:
     node_count: IntRange = (8000, 15000)
     mesh_degree: IntRange = (50, 50)  # fixed at 50
@@ -98,7 +98,7 @@ class ParameterRanges:
     node_types: tuple[NodeTypeConfig, ...] = tuple(DEFAULT_NODE_TYPES)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnomalyThresholds:
     max_p99_propagation_time: float = 10.0
     min_reconstruction_success_rate: float = 0.95
@@ -225,7 +225,7 @@ class MetricsCollector:
                 all_columns = 0
                 for mask in metrics.cell_masks.values():
                     all_columns |= mask
-                distinct_columns = bin(all_columns).count("1")
+                distinct_columns = all_columns.bit_count()
 
                 self.propagation_timeseries.append(
                     PropagationSnapshot(
@@ -256,7 +256,7 @@ class MetricsCollector:
             all_columns = 0
             for mask in metrics.cell_masks.values():
                 all_columns |= mask
-            if bin(all_columns).count("1") >= 64:
+            if all_columns.bit_count() >= 64:
                 reconstruction_successes += 1
 
         # Compute derived metrics
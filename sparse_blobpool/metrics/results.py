@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from sparse_blobpool.core.types import ActorId, TxHash
 
 
-@dataclass
+@dataclass(slots=True)
 class BandwidthSnapshot:
     timestamp: float
     total_bytes: int
@@ -19,7 +19,7 @@ class BandwidthSnapshot:
     per_country: dict[Country, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PropagationSnapshot:
     timestamp: float
     tx_hash: TxHash
@@ -29,7 +29,7 @@ class PropagationSnapshot:
     reconstruction_possible: bool  # >= 64 distinct columns exist
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResults:
     # Bandwidth efficiency
     total_bandwidth_bytes: int
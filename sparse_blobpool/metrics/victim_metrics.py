@@ -193,6 +193,8 @@ class VictimMetricsCollector:
                 attack_amplification=0.0,
             )
 
+        from sparse_blobpool.actors.honest import Node
+
         # Calculate per-victim metrics
         for victim_id, metrics in self.victim_metrics.items():
             # Bandwidth impact
@@ -215,14 +217,11 @@ class VictimMetricsCollector:
                 metrics.blobpool_pollution_rate = metrics.spam_txs_accepted / total_txs
 
             # Connectivity
-            from sparse_blobpool.actors.honest import Node
-
-            if victim_id in simulator.actors:
-                node = simulator.actors[victim_id]
-                if isinstance(node, Node):
-                    total_peers = len(node.peers)
-                    if total_peers > 0:
-                        metrics.connectivity_degradation = metrics.peers_lost / total_peers
+            node = simulator.actors.get(victim_id)
+            if isinstance(node, Node):
+                total_peers = len(node.peers)
+                if total_peers > 0:
+                    metrics.connectivity_degradation = metrics.peers_lost / total_peers
 
         # Aggregate metrics
         bandwidth_amplifications = [m.bandwidth_amplification for m in self.victim_metrics.values()]
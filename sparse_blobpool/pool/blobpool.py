@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from sparse_blobpool.protocol.constants import ALL_ONES, CELL_SIZE, CELLS_PER_BLOB
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from sparse_blobpool.config import SimulationConfig
     from sparse_blobpool.core.types import ActorId, Address, TxHash
 
@@ -43,7 +46,7 @@ class BlobTxEntry:
         return self.cell_mask == ALL_ONES
 
     def available_column_count(self) -> int:
-        return bin(self.cell_mask).count("1")
+        return self.cell_mask.bit_count()
 
 
 class RBFRejected(Exception):
@@ -103,6 +106,16 @@ class Blobpool:
         self._by_sender: dict[Address, dict[int, TxHash]] = {}  # sender -> nonce -> hash
         self._total_size = 0
 
+        # Max-heap on effective tip as (-tip, insertion seq, entry). Removed
+        # entries stay in place until compaction and are skipped on read; the
+        # seq tiebreak keeps equal tips in pool insertion order. A slot is live
+        # only if its seq is the one recorded for its hash in _heap_seq, so a
+        # removed and re-added entry doesn't show up twice.
+        self._priority_heap: list[tuple[int, int, BlobTxEntry]] = []
+        self._heap_seq: dict[TxHash, int] = {}
+        self._priority_seq = 0
+        self._stale_count = 0
+
     @property
     def size_bytes(self) -> int:
         return self._total_size
@@ -134,6 +147,100 @@ class Blobpool:
             RBFRejected: If replacement doesn't meet fee bump requirements.
             SenderLimitExceeded: If sender has too many non-replaceable transactions.
         """
+        result = self._admit(entry)
+        seq = self._priority_seq
+        heapq.heappush(self._priority_heap, (-entry.effective_tip, seq, entry))
+        self._heap_seq[entry.tx_hash] = seq
+        self._priority_seq = seq + 1
+        return result
+
+    def add_many(self, entries: Iterable[BlobTxEntry]) -> list[AddResult]:
+        """Add transactions in order, as if add() were called for each.
+
+        Admission checks (RBF, sender limit, eviction) run per entry, but the
+        priority heap is updated once for the whole batch: large batches are
+        merged with a single heapify, small ones pushed individually. Entries
+        admitted before a rejection stay in the pool.
+
+        Raises:
+            RBFRejected: If a replacement doesn't meet fee bump requirements.
+            SenderLimitExceeded: If a sender has too many non-replaceable transactions.
+            PoolFull: If an entry can't fit without evicting higher-priority ones.
+        """
+        results: list[AddResult] = []
+        admitted: list[BlobTxEntry] = []
+        try:
+            for entry in entries:
+                results.append(self._admit(entry))
+                admitted.append(entry)
+        finally:
+            self._push_priorities(admitted)
+        return results
+
+    def remove(self, tx_hash: TxHash) -> BlobTxEntry | None:
+        entry = self._txs.pop(tx_hash, None)
+        if entry is None:
+            return None
+        self._unindex(entry)
+        return entry
+
+    def remove_batch(self, tx_hashes: list[TxHash]) -> list[BlobTxEntry]:
+        return [e for h in tx_hashes if (e := self.remove(h)) is not None]
+
+    def update_cell_mask(self, tx_hash: TxHash, new_mask: int) -> bool:
+        entry = self._txs.get(tx_hash)
+        if entry is None:
+            return False
+        entry.cell_mask = new_mask
+        return True
+
+    def merge_cells(self, tx_hash: TxHash, received_mask: int) -> int | None:
+        entry = self._txs.get(tx_hash)
+        if entry is None:
+            return None
+        entry.cell_mask |= received_mask
+        return entry.cell_mask
+
+    def iter_by_priority(self) -> list[BlobTxEntry]:
+        return list(self.iter_top())
+
+    def iter_top(self, limit: int | None = None) -> Iterator[BlobTxEntry]:
+        """Yield pooled transactions by descending effective tip, lazily.
+
+        Walks the priority heap best-first, so a caller that stops after k
+        entries pays O(k log k) rather than sorting the whole pool. Equal tips
+        come out in insertion order, matching iter_by_priority(). The pool
+        must not be modified while the iterator is live.
+        """
+        if limit is None:
+            limit = len(self._txs)
+        heap = self._priority_heap
+        heap_seq = self._heap_seq
+        size = len(heap)
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and limit > 0:
+            (_, seq, entry), i = heapq.heappop(frontier)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size:
+                    heapq.heappush(frontier, (heap[child], child))
+            if heap_seq.get(entry.tx_hash) == seq:
+                yield entry
+                limit -= 1
+
+    def iter_expired(self, current_time: float, ttl: float) -> list[BlobTxEntry]:
+        cutoff = current_time - ttl
+        return [e for e in self._txs.values() if e.received_at < cutoff]
+
+    def clear(self) -> None:
+        self._txs.clear()
+        self._by_sender.clear()
+        self._total_size = 0
+        self._priority_heap.clear()
+        self._heap_seq.clear()
+        self._stale_count = 0
+
+    def _admit(self, entry: BlobTxEntry) -> AddResult:
+        """Run admission checks and index entry everywhere but the priority heap."""
         result = AddResult(added=False)
 
         # Check for existing transaction with same sender/nonce (RBF candidate)
@@ -166,47 +273,39 @@ class Blobpool:
 
         # Add the transaction
         self._txs[entry.tx_hash] = entry
-        if entry.sender not in self._by_sender:
-            self._by_sender[entry.sender] = {}
-        self._by_sender[entry.sender][entry.nonce] = entry.tx_hash
+        sender_index = self._by_sender.get(entry.sender)
+        if sender_index is None:
+            sender_index = self._by_sender[entry.sender] = {}
+        sender_index[entry.nonce] = entry.tx_hash
         self._total_size += entry.tx_size
         result.added = True
 
         return result
 
-    def remove(self, tx_hash: TxHash) -> BlobTxEntry | None:
-        if tx_hash not in self._txs:
-            return None
-        return self._remove_internal(tx_hash)
-
-    def remove_batch(self, tx_hashes: list[TxHash]) -> list[BlobTxEntry]:
-        return [e for h in tx_hashes if (e := self.remove(h)) is not None]
-
-    def update_cell_mask(self, tx_hash: TxHash, new_mask: int) -> bool:
-        entry = self._txs.get(tx_hash)
-        if entry is None:
-            return False
-        entry.cell_mask = new_mask
-        return True
-
-    def merge_cells(self, tx_hash: TxHash, received_mask: int) -> int | None:
-        entry = self._txs.get(tx_hash)
-        if entry is None:
-            return None
-        entry.cell_mask |= received_mask
-        return entry.cell_mask
-
-    def iter_by_priority(self) -> list[BlobTxEntry]:
-        return sorted(self._txs.values(), key=lambda e: e.effective_tip, reverse=True)
-
-    def iter_expired(self, current_time: float, ttl: float) -> list[BlobTxEntry]:
-        cutoff = current_time - ttl
-        return [e for e in self._txs.values() if e.received_at < cutoff]
-
-    def clear(self) -> None:
-        self._txs.clear()
-        self._by_sender.clear()
-        self._total_size = 0
+    def _push_priorities(self, entries: list[BlobTxEntry]) -> None:
+        """Add admitted entries to the priority heap in admission order."""
+        txs = self._txs
+        seq = self._priority_seq
+        pending: dict[TxHash, tuple[int, int, BlobTxEntry]] = {}
+        for entry in entries:
+            # Skip entries replaced or evicted later in the same batch; an entry
+            # admitted twice keeps only its last seq
+            if txs.get(entry.tx_hash) is entry:
+                pending[entry.tx_hash] = (-entry.effective_tip, seq, entry)
+            seq += 1
+        self._priority_seq = seq
+
+        heap_seq = self._heap_seq
+        for tx_hash, (_, item_seq, _) in pending.items():
+            heap_seq[tx_hash] = item_seq
+        items = list(pending.values())
+        heap = self._priority_heap
+        if len(items) * 4 > len(heap):
+            heap.extend(items)
+            heapq.heapify(heap)
+        else:
+            for item in items:
+                heapq.heappush(heap, item)
 
     def _can_replace(self, existing: BlobTxEntry, replacement: BlobTxEntry) -> bool:
         min_fee_cap = existing.gas_fee_cap * (100 + self.RBF_BUMP_PERCENT) // 100
@@ -217,6 +316,11 @@ class Blobpool:
     def _remove_internal(self, tx_hash: TxHash) -> BlobTxEntry:
         """Internal removal without existence check."""
         entry = self._txs.pop(tx_hash)
+        self._unindex(entry)
+        return entry
+
+    def _unindex(self, entry: BlobTxEntry) -> None:
+        """Drop an entry already popped from _txs from the size and sender index."""
         self._total_size -= entry.tx_size
 
         # Update sender index
@@ -226,7 +330,22 @@ class Blobpool:
             if not sender_nonces:
                 del self._by_sender[entry.sender]
 
-        return entry
+        # Lazily drop the heap slot; compact once most of the heap is stale.
+        # Entries admitted by add_many but not yet pushed have no slot.
+        if self._heap_seq.pop(entry.tx_hash, None) is None:
+            return
+        self._stale_count += 1
+        if self._stale_count > len(self._txs):
+            self._compact_priority_heap()
+
+    def _compact_priority_heap(self) -> None:
+        """Rebuild the priority heap from live entries only."""
+        heap_seq = self._heap_seq
+        self._priority_heap[:] = [
+            item for item in self._priority_heap if heap_seq.get(item[2].tx_hash) == item[1]
+        ]
+        heapq.heapify(self._priority_heap)
+        self._stale_count = 0
 
     def _evict_lowest_priority(
         self, exclude: TxHash | None = None, min_priority: int | None = None
@@ -2,11 +2,14 @@
 
 from sparse_blobpool.protocol.constants import (
     ALL_ONES,
+    BLOB_TX_SIZES,
+    BLOB_TX_TYPES,
     CELL_SIZE,
     CELLS_PER_BLOB,
     MAX_BLOBS_PER_TX,
     MESSAGE_OVERHEAD,
     RECONSTRUCTION_THRESHOLD,
+    columns_to_mask,
 )
 from sparse_blobpool.protocol.messages import (
     Block,
@@ -22,6 +25,8 @@ from sparse_blobpool.protocol.messages import (
 
 __all__ = [
     "ALL_ONES",
+    "BLOB_TX_SIZES",
+    "BLOB_TX_TYPES",
     "CELLS_PER_BLOB",
     "CELL_SIZE",
     "MAX_BLOBS_PER_TX",
@@ -36,4 +41,5 @@ __all__ = [
     "NewPooledTransactionHashes",
     "PooledTransactions",
     "TxBody",
+    "columns_to_mask",
 ]
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 # Re-export Command for convenience
 __all__ = [
+    "SLOT_TICK",
     "BroadcastTransaction",
     "Command",
     "ProduceBlock",
@@ -25,7 +26,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class BroadcastTransaction(Command):
     """Inject a new transaction into a node's pool and announce it."""
 
@@ -40,33 +41,37 @@ class BroadcastTransaction(Command):
     cell_mask: int  # Cells the origin has (ALL_ONES for full blob)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProduceBlock(Command):
     """Request a node to produce a block for a given slot."""
 
     slot: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotTick(Command):
     """Periodic slot boundary tick for block production."""
 
 
-@dataclass
+# Field-less commands carry no state, so one shared instance is reused per schedule
+SLOT_TICK = SlotTick()
+
+
+@dataclass(slots=True)
 class RequestTimeout(Command):
     """Timeout for a pending request (tx body or cells)."""
 
     request_id: RequestId
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderObservationTimeout(Command):
     """Timeout waiting for provider announcements before fetching."""
 
     tx_hash: TxHash
 
 
-@dataclass
+@dataclass(slots=True)
 class TxCleanup(Command):
     """Delayed cleanup of a transaction after block inclusion."""
 
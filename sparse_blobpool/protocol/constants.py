@@ -1,5 +1,12 @@
 """Protocol constants for EIP-8070 sparse blobpool."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 # Cell and blob constants
 CELL_SIZE = 2048  # bytes per cell
 CELLS_PER_BLOB = 128  # columns per extended blob
@@ -14,6 +21,19 @@ MAX_BLOBS_PER_TX = 6
 # Cell mask constants
 ALL_ONES = (1 << CELLS_PER_BLOB) - 1  # uint128 with all bits set (full availability)
 
+
+def columns_to_mask(columns: Iterable[int]) -> int:
+    """Build a cell mask with the bit for each given column index set."""
+    mask = 0
+    for col in columns:
+        mask |= 1 << col
+    return mask
+
+
+# Announcement fields for a single ~128 KB blob transaction (eth/68 type 3)
+BLOB_TX_TYPES = bytes([3])
+BLOB_TX_SIZES = (131072,)
+
 # Message IDs (eth/71 protocol)
 MSG_NEW_POOLED_TX_HASHES = 0x08
 MSG_GET_POOLED_TRANSACTIONS = 0x09
@@ -7,13 +7,15 @@ from sparse_blobpool.core.events import Message
 from sparse_blobpool.protocol.constants import CELL_SIZE, MESSAGE_OVERHEAD
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sparse_blobpool.core.types import ActorId, TxHash
 
 
-@dataclass
+@dataclass(slots=True)
 class NewPooledTransactionHashes(Message):
     types: bytes  # 1 byte per tx (3 = blob tx)
-    sizes: list[int]  # transaction sizes in bytes
+    sizes: Sequence[int]  # transaction sizes in bytes
     hashes: list[TxHash]  # 32 bytes each
     cell_mask: int | None = None  # uint128 bitmap, None if no type-3 txs
 
@@ -28,7 +30,7 @@ class NewPooledTransactionHashes(Message):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TxBody:
     tx_hash: TxHash
     tx_bytes: int
@@ -38,7 +40,7 @@ class TxBody:
         return self.tx_bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class GetPooledTransactions(Message):
     tx_hashes: list[TxHash]
 
@@ -47,7 +49,7 @@ class GetPooledTransactions(Message):
         return MESSAGE_OVERHEAD + len(self.tx_hashes) * 32
 
 
-@dataclass
+@dataclass(slots=True)
 class PooledTransactions(Message):
     transactions: list[TxBody | None]  # None for unavailable txs
 
@@ -56,7 +58,7 @@ class PooledTransactions(Message):
         return MESSAGE_OVERHEAD + sum(tx.size_bytes if tx else 0 for tx in self.transactions)
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     data: bytes = field(repr=False)  # CELL_SIZE bytes
     proof: bytes = field(repr=False)  # 48 bytes KZG proof
@@ -66,7 +68,7 @@ class Cell:
         return CELL_SIZE + 48
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCells(Message):
     tx_hashes: list[TxHash]
     cell_mask: int  # uint128 bitmap of requested columns
@@ -76,15 +78,15 @@ class GetCells(Message):
         return MESSAGE_OVERHEAD + len(self.tx_hashes) * 32 + 16
 
 
-@dataclass
+@dataclass(slots=True)
 class Cells(Message):
     tx_hashes: list[TxHash]
-    cells: list[list[Cell | None]]  # per-tx, per-column
+    cells: Sequence[Sequence[Cell | None]]  # per-tx, per-column
     cell_mask: int  # actual columns provided (uint128)
 
     @property
     def size_bytes(self) -> int:
-        cell_count = sum(sum(1 for c in tx_cells if c is not None) for tx_cells in self.cells)
+        cell_count = sum(len(tx_cells) - tx_cells.count(None) for tx_cells in self.cells)
         return (
             MESSAGE_OVERHEAD
             + len(self.tx_hashes) * 32  # hashes
@@ -93,14 +95,14 @@ class Cells(Message):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     slot: int
     proposer: ActorId
     blob_tx_hashes: list[TxHash]
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockBroadcast(Message):
     block: Block
 
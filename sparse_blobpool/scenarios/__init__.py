@@ -9,6 +9,7 @@ from sparse_blobpool.scenarios.attacks import (
     run_withholding_scenario,
 )
 from sparse_blobpool.scenarios.baseline import run_baseline_scenario
+from sparse_blobpool.scenarios.sweep import run_spam_sweep
 
 __all__ = [
     "PoisoningScenarioConfig",
@@ -17,5 +18,6 @@ __all__ = [
     "run_baseline_scenario",
     "run_poisoning_scenario",
     "run_spam_scenario",
+    "run_spam_sweep",
     "run_withholding_scenario",
 ]
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from hashlib import sha256
+from typing import TYPE_CHECKING, Any
 
 from sparse_blobpool.actors.adversaries.victim_selection import (
     VictimSelectionConfig,
@@ -16,21 +17,27 @@ from sparse_blobpool.actors.adversaries.victim_selection import (
 )
 from sparse_blobpool.config import SimulationConfig
 from sparse_blobpool.core.actor import Actor
-from sparse_blobpool.core.events import Command, EventPayload, Message
+from sparse_blobpool.core.events import Command
 from sparse_blobpool.core.simulator import Simulator
 from sparse_blobpool.core.types import ActorId, Address, TxHash
-from sparse_blobpool.protocol.constants import ALL_ONES
+from sparse_blobpool.protocol.constants import ALL_ONES, BLOB_TX_SIZES, BLOB_TX_TYPES
 from sparse_blobpool.protocol.messages import NewPooledTransactionHashes
+from sparse_blobpool.scenarios.attacks.selection import select_attacker_nodes
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@dataclass
+    from sparse_blobpool.core.events import EventPayload
+
+
+@dataclass(slots=True)
 class InjectNext(Command):
     """Trigger next poison tx injection in a nonce chain."""
 
     victim_id: ActorId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PoisoningScenarioConfig:
     """Configuration for targeted poisoning attack scenario."""
 
@@ -82,6 +89,11 @@ class TargetedPoisoningAdversary(Actor):
             controlled_nodes=controlled_nodes,
         )
         self._victim_nonces: dict[ActorId, int] = {}
+        self._hash_prefixes: dict[ActorId, bytes] = {}
+
+        self._handlers: dict[type[EventPayload], Callable[[Any], None]] = {
+            InjectNext: self._handle_inject_next,
+        }
 
     @property
     def victims(self) -> list[ActorId]:
@@ -93,19 +105,12 @@ class TargetedPoisoningAdversary(Actor):
         return self._controlled_nodes
 
     def on_event(self, payload: EventPayload) -> None:
-        match payload:
-            case Message() as msg:
-                self._on_message(msg)
-            case Command() as cmd:
-                self._on_command(cmd)
+        handler = self._handlers.get(type(payload))
+        if handler is not None:
+            handler(payload)
 
-    def _on_message(self, msg: Message) -> None:
-        pass
-
-    def _on_command(self, cmd: Command) -> None:
-        match cmd:
-            case InjectNext(victim_id=victim_id):
-                self._inject_next_tx(victim_id)
+    def _handle_inject_next(self, cmd: InjectNext) -> None:
+        self._inject_next_tx(cmd.victim_id)
 
     def execute(self) -> None:
         self._attack_started = True
@@ -125,9 +130,9 @@ class TargetedPoisoningAdversary(Actor):
         tx_hash = self._create_poison_tx(victim_id, nonce)
 
         announcement = NewPooledTransactionHashes(
-            sender=self.id,
-            types=bytes([3]),  # Blob tx type
-            sizes=[131072],
+            sender=self._id,
+            types=BLOB_TX_TYPES,
+            sizes=BLOB_TX_SIZES,
             hashes=[tx_hash],
             cell_mask=ALL_ONES,  # Claim to be provider
         )
@@ -147,8 +152,11 @@ class TargetedPoisoningAdversary(Actor):
             )
 
     def _create_poison_tx(self, victim_id: ActorId, nonce: int) -> TxHash:
-        data = f"poison:{self.id}:{victim_id}:{self._sender}:{nonce}".encode()
-        return TxHash(sha256(data).hexdigest())
+        prefix = self._hash_prefixes.get(victim_id)
+        if prefix is None:
+            prefix = f"poison:{self._id}:{victim_id}:{self._sender}:".encode()
+            self._hash_prefixes[victim_id] = prefix
+        return TxHash(sha256(prefix + str(nonce).encode()).hexdigest())
 
     def get_attack_progress(self) -> dict[str, int | float]:
         total_nonces = sum(self._victim_nonces.values())
@@ -197,8 +205,8 @@ def run_poisoning_scenario(
     all_node_ids = [node.id for node in sim.nodes]
 
     # Select controlled nodes
-    controlled_nodes = _select_attacker_nodes(
-        sim, attack_config.num_attacker_connections, all_node_ids
+    controlled_nodes = select_attacker_nodes(
+        sim.rng, all_node_ids, attack_config.num_attacker_connections
     )
 
     adversary_id = ActorId("poisoning_adversary")
@@ -211,9 +219,7 @@ def run_poisoning_scenario(
     )
     sim.register_actor(adversary)
 
-    for _ in range(num_transactions):
-        origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-        sim.broadcast_transaction(sim.nodes[origin_idx])
+    sim.broadcast_transactions(sim.rng.choices(sim.nodes, k=num_transactions))
 
     adversary.execute()
 
@@ -221,16 +227,3 @@ def run_poisoning_scenario(
     sim.run(run_duration)
 
     return sim
-
-
-def _select_attacker_nodes(
-    sim: Simulator,
-    num_connections: int,
-    all_node_ids: list[ActorId],
-) -> list[ActorId]:
-    """Select nodes to use as attacker connections."""
-    if num_connections >= len(all_node_ids):
-        return all_node_ids
-
-    indices = sim.rng.sample(range(len(all_node_ids)), num_connections)
-    return [all_node_ids[i] for i in indices]
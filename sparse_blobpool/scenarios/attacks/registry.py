@@ -16,6 +16,7 @@ from sparse_blobpool.actors.adversaries.victim_selection import (
     VictimSelectionStrategy,
     create_victim_selector,
 )
+from sparse_blobpool.protocol.constants import ALL_ONES
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -276,6 +277,10 @@ def create_attack_executor(
     """
 
     def executor(sim: Simulator) -> None:
+        # sim.nodes rescans every actor, so resolve the ids once per attack
+        node_ids = [n.id for n in sim.nodes]
+        attacker_count = min(attack_selection.attacker_count, len(node_ids))
+
         match attack_selection.attack_type:
             case AttackType.NONE:
                 # No attack, just baseline
@@ -285,9 +290,7 @@ def create_attack_executor(
                 from sparse_blobpool.scenarios.attacks.spam import SpamAdversary, SpamScenarioConfig
 
                 # Select attacker nodes
-                attacker_nodes = sim.rng.sample(
-                    [n.id for n in sim.nodes], min(attack_selection.attacker_count, len(sim.nodes))
-                )
+                attacker_nodes = sim.rng.sample(node_ids, attacker_count)
 
                 victim_config = None
                 if attack_selection.victim_profile:
@@ -311,7 +314,7 @@ def create_attack_executor(
                     simulator=sim,
                     controlled_nodes=attacker_nodes,
                     spam_config=spam_config,
-                    all_nodes=[n.id for n in sim.nodes],
+                    all_nodes=node_ids,
                 )
 
                 sim.register_actor(adversary)
@@ -323,9 +326,7 @@ def create_attack_executor(
                     WithholdingScenarioConfig,
                 )
 
-                attacker_nodes = sim.rng.sample(
-                    [n.id for n in sim.nodes], min(attack_selection.attacker_count, len(sim.nodes))
-                )
+                attacker_nodes = sim.rng.sample(node_ids, attacker_count)
 
                 victim_config = None
                 if attack_selection.victim_profile:
@@ -338,13 +339,14 @@ def create_attack_executor(
                 withhold_columns = attack_selection.attack_params.get("withhold_columns")
                 if isinstance(withhold_columns, int) and withhold_columns > 0:
                     withhold_columns = min(withhold_columns, 128)
-                    withhold_set = set(sim.rng.sample(range(128), withhold_columns))
-                    columns_to_serve = frozenset(i for i in range(128) if i not in withhold_set)
+                    columns_to_serve_mask = ALL_ONES
+                    for col in sim.rng.sample(range(128), withhold_columns):
+                        columns_to_serve_mask ^= 1 << col
                 else:
-                    columns_to_serve = frozenset(range(64))
+                    columns_to_serve_mask = (1 << 64) - 1
 
                 withholding_config = WithholdingScenarioConfig(
-                    columns_to_serve=columns_to_serve,
+                    columns_to_serve_mask=columns_to_serve_mask,
                     attack_start_time=0.0,  # Start attacks immediately
                     victim_selection_config=victim_config,
                 )
@@ -354,7 +356,7 @@ def create_attack_executor(
                     simulator=sim,
                     controlled_nodes=attacker_nodes,
                     withholding_config=withholding_config,
-                    all_nodes=[n.id for n in sim.nodes],
+                    all_nodes=node_ids,
                 )
 
                 sim.register_actor(adversary)
@@ -366,9 +368,7 @@ def create_attack_executor(
                     TargetedPoisoningAdversary,
                 )
 
-                attacker_nodes = sim.rng.sample(
-                    [n.id for n in sim.nodes], min(attack_selection.attacker_count, len(sim.nodes))
-                )
+                attacker_nodes = sim.rng.sample(node_ids, attacker_count)
 
                 victim_config = None
                 if attack_selection.victim_profile:
@@ -392,7 +392,7 @@ def create_attack_executor(
                     simulator=sim,
                     controlled_nodes=attacker_nodes,
                     poisoning_config=poisoning_config,
-                    all_nodes=[n.id for n in sim.nodes],
+                    all_nodes=node_ids,
                 )
 
                 sim.register_actor(adversary)
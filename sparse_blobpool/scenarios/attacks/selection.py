@@ -0,0 +1,26 @@
+"""Attacker node selection shared by the attack scenario runners."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+    from sparse_blobpool.core.types import ActorId
+
+
+def select_attacker_nodes(
+    rng: Random,
+    all_node_ids: list[ActorId],
+    num_nodes: int,
+) -> list[ActorId]:
+    """Select nodes to be controlled by the adversary.
+
+    Returns a uniform sample of num_nodes distinct ids, or a copy of every id
+    when num_nodes covers the whole network.
+    """
+    if num_nodes >= len(all_node_ids):
+        return list(all_node_ids)
+
+    return rng.sample(all_node_ids, num_nodes)
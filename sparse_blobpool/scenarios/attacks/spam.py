@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from hashlib import sha256
+from typing import TYPE_CHECKING, Any
 
 from sparse_blobpool.actors.adversaries.victim_selection import (
     VictimSelectionConfig,
@@ -16,19 +17,28 @@ from sparse_blobpool.actors.adversaries.victim_selection import (
 )
 from sparse_blobpool.config import SimulationConfig
 from sparse_blobpool.core.actor import Actor
-from sparse_blobpool.core.events import Command, EventPayload, Message
+from sparse_blobpool.core.events import Command
 from sparse_blobpool.core.simulator import Simulator
 from sparse_blobpool.core.types import ActorId, TxHash
-from sparse_blobpool.protocol.constants import ALL_ONES
+from sparse_blobpool.protocol.constants import ALL_ONES, BLOB_TX_SIZES, BLOB_TX_TYPES
 from sparse_blobpool.protocol.messages import NewPooledTransactionHashes
+from sparse_blobpool.scenarios.attacks.selection import select_attacker_nodes
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-@dataclass
+    from sparse_blobpool.core.events import EventPayload
+
+
+@dataclass(slots=True)
 class SpamNext(Command):
     """Trigger next spam tx injection."""
 
 
-@dataclass(frozen=True)
+SPAM_NEXT = SpamNext()
+
+
+@dataclass(frozen=True, slots=True)
 class SpamScenarioConfig:
     """Configuration for spam attack scenario."""
 
@@ -62,6 +72,8 @@ class SpamAdversary(Actor):
         self._spam_config = spam_config
         self._all_nodes = all_nodes
         self._spam_counter = 0
+        self._cell_mask = ALL_ONES if self._spam_config.valid_headers else 0
+        self._hash_prefix = sha256(f"spam:{actor_id}:".encode())
         self._attack_started = False
         self._attack_stopped = False
 
@@ -76,6 +88,10 @@ class SpamAdversary(Actor):
             controlled_nodes=controlled_nodes,
         )
 
+        self._handlers: dict[type[EventPayload], Callable[[Any], None]] = {
+            SpamNext: self._handle_spam_next,
+        }
+
     @property
     def controlled_nodes(self) -> list[ActorId]:
         return self._controlled_nodes
@@ -86,20 +102,13 @@ class SpamAdversary(Actor):
         return self._victim_selector.get_victims()
 
     def on_event(self, payload: EventPayload) -> None:
-        match payload:
-            case Message() as msg:
-                self._on_message(msg)
-            case Command() as cmd:
-                self._on_command(cmd)
-
-    def _on_message(self, msg: Message) -> None:
-        pass
+        handler = self._handlers.get(type(payload))
+        if handler is not None:
+            handler(payload)
 
-    def _on_command(self, cmd: Command) -> None:
-        match cmd:
-            case SpamNext():
-                self._inject_spam()
-                self._schedule_next_spam()
+    def _handle_spam_next(self, cmd: SpamNext) -> None:
+        self._inject_spam()
+        self._schedule_next_spam()
 
     def execute(self) -> None:
         self._attack_started = True
@@ -110,33 +119,32 @@ class SpamAdversary(Actor):
             return
 
         delay = 1.0 / self._spam_config.spam_rate
-        self.schedule_command(delay, SpamNext())
+        self.schedule_command(delay, SPAM_NEXT)
 
     def _inject_spam(self) -> None:
         tx_hash = self._generate_spam_tx_hash()
         self._spam_counter += 1
 
-        cell_mask = ALL_ONES if self._spam_config.valid_headers else 0
         announcement = NewPooledTransactionHashes(
-            sender=self.id,
-            types=bytes([3]),  # Blob tx type
-            sizes=[131072],  # ~128 KB tx size
+            sender=self._id,
+            types=BLOB_TX_TYPES,
+            sizes=BLOB_TX_SIZES,
             hashes=[tx_hash],
-            cell_mask=cell_mask,
+            cell_mask=self._cell_mask,
         )
 
         # Use victim selector to determine targets
         targets = self._victim_selector.get_victims()
-        for target in targets:
-            self.send(announcement, to=target)
+        self.send_many(announcement, to=targets)
 
         # Record spam sent to victims in metrics
         for victim_id in targets:
             self.simulator.metrics.record_victim_targeted(victim_id, "spam", tx_hash)
 
     def _generate_spam_tx_hash(self) -> TxHash:
-        data = f"spam:{self.id}:{self._spam_counter}".encode()
-        return TxHash(sha256(data).hexdigest())
+        h = self._hash_prefix.copy()
+        h.update(str(self._spam_counter).encode())
+        return TxHash(h.hexdigest())
 
 
 def run_spam_scenario(
@@ -171,7 +179,9 @@ def run_spam_scenario(
     sim = Simulator.build(config)
 
     all_node_ids = [node.id for node in sim.nodes]
-    controlled_nodes = _select_attacker_nodes(sim, attack_config.num_attacker_nodes, all_node_ids)
+    controlled_nodes = select_attacker_nodes(
+        sim.rng, all_node_ids, attack_config.num_attacker_nodes
+    )
 
     adversary_id = ActorId("spam_adversary")
     adversary = SpamAdversary(
@@ -183,9 +193,7 @@ def run_spam_scenario(
     )
     sim.register_actor(adversary)
 
-    for _ in range(num_transactions):
-        origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-        sim.broadcast_transaction(sim.nodes[origin_idx])
+    sim.broadcast_transactions(sim.rng.choices(sim.nodes, k=num_transactions))
 
     adversary.execute()
 
@@ -193,16 +201,3 @@ def run_spam_scenario(
     sim.run(run_duration)
 
     return sim
-
-
-def _select_attacker_nodes(
-    sim: Simulator,
-    num_nodes: int,
-    all_node_ids: list[ActorId],
-) -> list[ActorId]:
-    """Select nodes to be controlled by the adversary."""
-    if num_nodes >= len(all_node_ids):
-        return list(all_node_ids)
-
-    indices = sim.rng.sample(range(len(all_node_ids)), num_nodes)
-    return [all_node_ids[i] for i in indices]
@@ -6,7 +6,8 @@ Detection relies on C_extra sampling (honest nodes sample extra columns beyond c
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from sparse_blobpool.actors.adversaries.victim_selection import (
     VictimSelectionConfig,
@@ -15,22 +16,33 @@ from sparse_blobpool.actors.adversaries.victim_selection import (
 )
 from sparse_blobpool.config import SimulationConfig
 from sparse_blobpool.core.actor import Actor
-from sparse_blobpool.core.events import Command, EventPayload, Message
 from sparse_blobpool.core.simulator import Simulator
 from sparse_blobpool.core.types import ActorId
+from sparse_blobpool.protocol.constants import ALL_ONES, columns_to_mask
 from sparse_blobpool.protocol.messages import Cells, GetCells
+from sparse_blobpool.scenarios.attacks.selection import select_attacker_nodes
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
-@dataclass(frozen=True)
+    from sparse_blobpool.core.events import EventPayload
+
+
+@dataclass(frozen=True, slots=True)
 class WithholdingScenarioConfig:
     """Configuration for withholding attack scenario."""
 
-    columns_to_serve: frozenset[int] = field(default_factory=lambda: frozenset(range(64)))
+    columns_to_serve_mask: int = (1 << 64) - 1  # uint128 bitmap, first 64 columns by default
     delay_other_columns: float | None = None
     num_attacker_nodes: int = 1
     victim_selection_config: VictimSelectionConfig | None = None
     attack_start_time: float = 0.0
 
+    @classmethod
+    def from_columns(cls, columns: Iterable[int], **kwargs: Any) -> WithholdingScenarioConfig:
+        """Build a config that serves exactly the given column indices."""
+        return cls(columns_to_serve_mask=columns_to_mask(columns), **kwargs)
+
 
 class WithholdingAdversary(Actor):
     """Serve custody cells but withhold reconstruction data.
@@ -43,6 +55,19 @@ class WithholdingAdversary(Actor):
     beyond custody, which reveals withholding with high probability.
     """
 
+    __slots__ = (
+        "_affected_victims",
+        "_allowed_mask",
+        "_attack_started",
+        "_attack_stopped",
+        "_controlled_nodes",
+        "_disallowed_mask",
+        "_handlers",
+        "_victim_selector",
+        "_victim_set",
+        "_withholding_config",
+    )
+
     def __init__(
         self,
         actor_id: ActorId,
@@ -54,7 +79,8 @@ class WithholdingAdversary(Actor):
         super().__init__(actor_id, simulator)
         self._controlled_nodes = controlled_nodes
         self._withholding_config = withholding_config
-        self._allowed_mask = self._compute_allowed_mask()
+        self._allowed_mask = withholding_config.columns_to_serve_mask
+        self._disallowed_mask = ALL_ONES & ~self._allowed_mask
         self._attack_started = False
         self._attack_stopped = False
 
@@ -69,47 +95,42 @@ class WithholdingAdversary(Actor):
             controlled_nodes=controlled_nodes,
         )
         self._affected_victims: set[ActorId] = set()
+        # Resolved on first use so victim selection draws from the RNG at the same point
+        self._victim_set: frozenset[ActorId] | None = None
 
-    def _compute_allowed_mask(self) -> int:
-        mask = 0
-        for col in self._withholding_config.columns_to_serve:
-            mask |= 1 << col
-        return mask
+        # Keyed on the exact payload type; all other events are ignored
+        self._handlers: dict[type[EventPayload], Callable[[Any], None]] = {
+            GetCells: self._handle_get_cells,
+        }
 
     def on_event(self, payload: EventPayload) -> None:
-        match payload:
-            case Message() as msg:
-                self._on_message(msg)
-            case Command() as cmd:
-                self._on_command(cmd)
-
-    def _on_message(self, msg: Message) -> None:
-        match msg:
-            case GetCells() as req:
-                self._handle_get_cells(req)
-
-    def _on_command(self, cmd: Command) -> None:
-        pass
+        handler = self._handlers.get(type(payload))
+        if handler is not None:
+            handler(payload)
 
     def execute(self) -> None:
         self._attack_started = True
 
     def _handle_get_cells(self, req: GetCells) -> None:
-        # Check if requester is a victim we should withhold from
-        if req.sender not in self._victim_selector.get_victims():
+        # Outside the attack window, serve everything requested
+        if not self._attack_started or self._attack_stopped:
+            self._serve_cells(req, req.cell_mask)
+            return
+
+        victim_set = self._victim_set
+        if victim_set is None:
+            victim_set = self._victim_set = frozenset(self._victim_selector.get_victims())
+        if req.sender not in victim_set:
             # Not a victim, serve normally
-            response = Cells(
-                sender=self.id,
-                tx_hashes=req.tx_hashes,
-                cells=[[] for _ in req.tx_hashes],  # Simplified - no actual cell data
-                cell_mask=req.cell_mask,
-            )
-            self.send(response, to=req.sender)
+            self._serve_cells(req, req.cell_mask)
             return
 
         # This is a victim - withhold data
-        allowed = req.cell_mask & self._allowed_mask
-        if allowed != req.cell_mask:
+        allowed = req.cell_mask
+        withheld = allowed & self._disallowed_mask
+        if withheld:
+            allowed ^= withheld
+
             # Track that this victim was affected
             self._affected_victims.add(req.sender)
 
@@ -125,21 +146,20 @@ class WithholdingAdversary(Actor):
                 pass
 
         if allowed:
-            response = Cells(
-                sender=self.id,
-                tx_hashes=req.tx_hashes,
-                cells=[[] for _ in req.tx_hashes],  # Simplified - no actual cell data
-                cell_mask=allowed,
-            )
-            self.send(response, to=req.sender)
-
-    def get_withheld_columns(self, request_mask: int) -> set[int]:
-        withheld = request_mask & ~self._allowed_mask
-        columns = set()
-        for i in range(128):
-            if withheld & (1 << i):
-                columns.add(i)
-        return columns
+            self._serve_cells(req, allowed)
+
+    def _serve_cells(self, req: GetCells, cell_mask: int) -> None:
+        response = Cells(
+            sender=self._id,
+            tx_hashes=req.tx_hashes,
+            cells=((),) * len(req.tx_hashes),  # Simplified - no actual cell data
+            cell_mask=cell_mask,
+        )
+        self.send(response, to=req.sender)
+
+    def get_withheld_columns(self, request_mask: int) -> int:
+        """Return the mask of requested columns this adversary would not serve."""
+        return request_mask & self._disallowed_mask
 
     @property
     def controlled_nodes(self) -> list[ActorId]:
@@ -189,7 +209,9 @@ def run_withholding_scenario(
     sim = Simulator.build(config)
 
     all_node_ids = [node.id for node in sim.nodes]
-    controlled_nodes = _select_attacker_nodes(sim, attack_config, all_node_ids)
+    controlled_nodes = select_attacker_nodes(
+        sim.rng, all_node_ids, attack_config.num_attacker_nodes
+    )
 
     adversary_id = ActorId("withholding_adversary")
     adversary = WithholdingAdversary(
@@ -201,9 +223,7 @@ def run_withholding_scenario(
     )
     sim.register_actor(adversary)
 
-    for _ in range(num_transactions):
-        origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-        sim.broadcast_transaction(sim.nodes[origin_idx])
+    sim.broadcast_transactions(sim.rng.choices(sim.nodes, k=num_transactions))
 
     adversary.execute()
 
@@ -211,18 +231,3 @@ def run_withholding_scenario(
     sim.run(run_duration)
 
     return sim
-
-
-def _select_attacker_nodes(
-    sim: Simulator,
-    attack_config: WithholdingScenarioConfig,
-    all_node_ids: list[ActorId],
-) -> list[ActorId]:
-    """Select nodes to be controlled by the adversary."""
-    num_nodes = attack_config.num_attacker_nodes
-
-    if num_nodes >= len(all_node_ids):
-        return list(all_node_ids)
-
-    indices = sim.rng.sample(range(len(all_node_ids)), num_nodes)
-    return [all_node_ids[i] for i in indices]
@@ -20,9 +20,7 @@ def run_baseline_scenario(
 
     sim = Simulator.build(config)
 
-    for _ in range(num_transactions):
-        origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-        sim.broadcast_transaction(sim.nodes[origin_idx])
+    sim.broadcast_transactions(sim.rng.choices(sim.nodes, k=num_transactions))
 
     sim.block_producer.start()
     sim.run(run_duration)
@@ -47,18 +45,13 @@ def main() -> None:
     build_time = time.time() - start
     print(f"Build completed in {build_time:.2f}s")
 
-    min_peers = min(len(node.peers) for node in sim.nodes)
-    max_peers = max(len(node.peers) for node in sim.nodes)
-    avg_peers = sum(len(node.peers) for node in sim.nodes) / len(sim.nodes)
-    print(f"Peer connections: min={min_peers}, avg={avg_peers:.1f}, max={max_peers}")
+    peer_counts = [len(node.peers) for node in sim.nodes]
+    avg_peers = sum(peer_counts) / len(peer_counts)
+    print(f"Peer connections: min={min(peer_counts)}, avg={avg_peers:.1f}, max={max(peer_counts)}")
     print(f"Total edges in topology: {len(sim.topology.edges)}")
 
     print("\nBroadcasting 10 transactions...")
-    tx_hashes = []
-    for _ in range(10):
-        origin_idx = sim.rng.randint(0, len(sim.nodes) - 1)
-        tx_hash = sim.broadcast_transaction(sim.nodes[origin_idx])
-        tx_hashes.append(tx_hash)
+    tx_hashes = sim.broadcast_transactions(sim.rng.choices(sim.nodes, k=10))
 
     sim.block_producer.start()
 
@@ -77,10 +70,11 @@ def main() -> None:
     print(f"Blobs included: {sim.block_producer.total_blobs_included}")
 
     print("\n=== Transaction Propagation ===")
+    pools = [node.pool for node in sim.nodes]
     for tx_hash in tx_hashes[:3]:
-        nodes_with_tx = sum(1 for node in sim.nodes if node.pool.contains(tx_hash))
-        pct = 100 * nodes_with_tx / len(sim.nodes)
-        print(f"{tx_hash[:16]}...: {nodes_with_tx}/{len(sim.nodes)} nodes ({pct:.1f}%)")
+        nodes_with_tx = sum(pool.contains(tx_hash) for pool in pools)
+        pct = 100 * nodes_with_tx / len(pools)
+        print(f"{tx_hash[:16]}...: {nodes_with_tx}/{len(pools)} nodes ({pct:.1f}%)")
 
     print("\n=== Metrics Analysis ===")
     metrics_results = sim.finalize_metrics()
@@ -0,0 +1,60 @@
+"""Parallel parameter sweeps over independent scenario runs."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from sparse_blobpool.scenarios.attacks.spam import run_spam_scenario
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sparse_blobpool.config import SimulationConfig
+    from sparse_blobpool.metrics.results import SimulationResults
+    from sparse_blobpool.scenarios.attacks.spam import SpamScenarioConfig
+
+
+def _run_spam(
+    config: SimulationConfig,
+    attack_config: SpamScenarioConfig,
+    num_transactions: int,
+    run_duration: float | None,
+) -> SimulationResults:
+    sim = run_spam_scenario(
+        config=config,
+        attack_config=attack_config,
+        num_transactions=num_transactions,
+        run_duration=run_duration,
+    )
+    return sim.finalize_metrics()
+
+
+def run_spam_sweep(
+    runs: Sequence[tuple[SimulationConfig, SpamScenarioConfig]],
+    num_transactions: int = 10,
+    run_duration: float | None = None,
+    max_workers: int | None = None,
+) -> list[SimulationResults]:
+    """Run spam scenarios in parallel, one process per run.
+
+    Each run is fully determined by its configs (including config.seed) and
+    shares no state with the others, so runs are farmed out to a process pool
+    to sidestep the GIL. Only the finalized metrics cross the process
+    boundary; the simulators themselves stay in the workers.
+
+    Args:
+        runs: (simulation config, attack config) pair for each run.
+        num_transactions: Number of legitimate transactions per run.
+        run_duration: Duration of each run. Defaults to each config's duration.
+        max_workers: Process count. Defaults to the number of CPUs.
+
+    Returns:
+        Results in the same order as runs.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_run_spam, config, attack_config, num_transactions, run_duration)
+            for config, attack_config in runs
+        ]
+        return [future.result() for future in futures]
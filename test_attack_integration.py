@@ -97,7 +97,7 @@ def test_withholding_with_victim_selection():
 
     # Test edge node victim selection
     withholding_config = WithholdingScenarioConfig(
-        columns_to_serve=frozenset(range(64)),  # Only serve first 64 columns
+        columns_to_serve_mask=(1 << 64) - 1,  # Only serve first 64 columns
         num_attacker_nodes=10,
         victim_selection_config=VictimSelectionConfig(
             strategy=VictimSelectionStrategy.EDGE,
@@ -12,7 +12,8 @@ from sparse_blobpool.actors.adversaries import (
     WithholdingConfig,
 )
 from sparse_blobpool.core.simulator import Simulator
-from sparse_blobpool.core.types import ActorId
+from sparse_blobpool.core.types import ActorId, TxHash
+from sparse_blobpool.protocol.messages import Cells, GetCells
 
 
 @pytest.fixture
@@ -124,7 +125,42 @@ class TestWithholdingAdversary:
 
         request_mask = 0b11111  # Columns 0-4
         withheld = adversary.get_withheld_columns(request_mask)
-        assert withheld == {1, 3}  # Columns 1 and 3 are withheld
+        assert withheld == 0b01010  # Columns 1 and 3 are withheld
+
+    def test_withholding_adversary_get_withheld_columns_all_served(
+        self, simulator: Simulator
+    ) -> None:
+        config = WithholdingConfig(columns_to_serve={0, 1, 2, 3})
+        adversary = WithholdingAdversary(
+            actor_id=ActorId("withholder"),
+            simulator=simulator,
+            controlled_nodes=[],
+            attack_config=config,
+        )
+
+        assert adversary.get_withheld_columns(0b0110) == 0
+
+    def test_withholding_adversary_serves_everything_outside_attack(
+        self, simulator: Simulator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        config = WithholdingConfig(columns_to_serve={0})
+        adversary = WithholdingAdversary(
+            actor_id=ActorId("withholder"),
+            simulator=simulator,
+            controlled_nodes=[],
+            attack_config=config,
+        )
+        sent: list[Cells] = []
+        monkeypatch.setattr(adversary, "send", lambda msg, to: sent.append(msg))
+        request = GetCells(sender=ActorId("victim"), tx_hashes=[TxHash("0x01")], cell_mask=0b111)
+
+        adversary.on_event(request)  # Not started yet
+        adversary.execute()
+        adversary.on_event(request)
+        adversary.stop()
+        adversary.on_event(request)
+
+        assert [msg.cell_mask for msg in sent] == [0b111, 0b001, 0b111]
 
 
 class TestAttackConfig:
@@ -1,5 +1,9 @@
 """Tests for simulation configuration."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from sparse_blobpool.config import SimulationConfig
 from sparse_blobpool.core.topology import (
     DIVERSE,
@@ -68,8 +72,5 @@ class TestSimulationConfig:
         """Configuration is immutable after creation."""
         config = SimulationConfig()
 
-        try:
+        with pytest.raises(FrozenInstanceError):
             config.node_count = 100  # type: ignore[misc]
-            raise AssertionError("Should have raised FrozenInstanceError")
-        except AttributeError:
-            pass  # Expected for frozen dataclass
@@ -1,8 +1,11 @@
 """Tests for the BlockProducer actor."""
 
+from dataclasses import replace
+
 import pytest
 
-from sparse_blobpool.actors.honest import Node
+from sparse_blobpool.actors.block_producer import BLOCK_PRODUCER_ID, BlockProducer
+from sparse_blobpool.actors.honest import CLEANUP_DELAY, Node, PendingTx, Role, TxState
 from sparse_blobpool.config import InclusionPolicy, SimulationConfig
 from sparse_blobpool.core.network import Network
 from sparse_blobpool.core.simulator import Simulator
@@ -11,10 +14,31 @@ from sparse_blobpool.metrics.collector import MetricsCollector
 from sparse_blobpool.pool.blobpool import BlobTxEntry
 from sparse_blobpool.protocol.constants import ALL_ONES
 
-
-@pytest.fixture
+# Fixed tx hashes and senders shared by the single-node block tests
+TX_HASH_A = "0x" + "aa" * 32
+TX_HASH_B = "0x" + "bb" * 32
+SENDER_A = "0x" + "11" * 20
+SENDER_B = "0x" + "22" * 20
+
+# Fee and size fields common to every test tx. replace() copies announced_to by
+# reference, so create_blob_tx must pass a fresh set for each copy.
+TEMPLATE_TX = BlobTxEntry(
+    tx_hash=TxHash(""),
+    sender=Address(""),
+    nonce=0,
+    gas_fee_cap=1000000000,
+    gas_tip_cap=100000000,
+    blob_gas_price=1000000,
+    tx_size=131072,
+    blob_count=1,
+    cell_mask=ALL_ONES,
+    received_at=0.0,
+)
+
+
+@pytest.fixture(scope="module")
 def config() -> SimulationConfig:
-    """Create test configuration with fast slots for testing."""
+    """Create test configuration with fast slots for testing (frozen, so shared)."""
     return SimulationConfig(
         provider_probability=0.15,
         min_providers_before_sample=2,
@@ -47,18 +71,33 @@ def network(simulator: Simulator, metrics: MetricsCollector) -> Network:
 def create_node(
     simulator: Simulator,
     network: Network,
+    metrics: MetricsCollector,
     config: SimulationConfig,
     node_id: str,
     country: str = "united states",
 ) -> Node:
-    """Helper to create and register a node."""
-    metrics = MetricsCollector(simulator=simulator)
+    """Helper to create and register a node recording into the shared metrics collector."""
     node = Node(ActorId(node_id), simulator, config, custody_columns=8, metrics=metrics)
     simulator.register_actor(node)
     network.register_node(node.id, country)
     return node
 
 
+def create_mesh(
+    simulator: Simulator,
+    network: Network,
+    metrics: MetricsCollector,
+    config: SimulationConfig,
+    count: int,
+) -> list[Node]:
+    """Helper to create count nodes that are all peered with each other."""
+    nodes = [create_node(simulator, network, metrics, config, f"node-{i}") for i in range(count)]
+    ids = [node.id for node in nodes]
+    for node in nodes:
+        node.add_peers(peer_id for peer_id in ids if peer_id != node.id)
+    return nodes
+
+
 def create_blob_tx(
     tx_hash: str,
     sender: str,
@@ -67,33 +106,33 @@ def create_blob_tx(
     blob_count: int = 1,
     cell_mask: int = ALL_ONES,
 ) -> BlobTxEntry:
-    """Helper to create a blob transaction entry."""
-    return BlobTxEntry(
+    """Helper to create a blob transaction entry from the shared template."""
+    return replace(
+        TEMPLATE_TX,
         tx_hash=TxHash(tx_hash),
         sender=Address(sender),
         nonce=nonce,
-        gas_fee_cap=1000000000,
         gas_tip_cap=gas_tip_cap,
-        blob_gas_price=1000000,
-        tx_size=131072,
         blob_count=blob_count,
         cell_mask=cell_mask,
-        received_at=0.0,
+        announced_to=set(),
     )
 
 
+@pytest.fixture
+def sample_txs() -> list[BlobTxEntry]:
+    """Five single-blob txs from distinct senders with ascending tips."""
+    return [create_blob_tx(f"0x{i:064x}", f"0x{i:040x}", gas_tip_cap=100 + i) for i in range(5)]
+
+
 class TestBlockProducerInitialization:
     def test_has_correct_id(self, simulator: Simulator, config: SimulationConfig) -> None:
         """BlockProducer has the correct actor ID."""
-        from sparse_blobpool.actors.block_producer import BLOCK_PRODUCER_ID, BlockProducer
-
         bp = BlockProducer(simulator, config=config)
         assert bp.id == BLOCK_PRODUCER_ID
 
     def test_initial_slot_is_zero(self, simulator: Simulator, config: SimulationConfig) -> None:
         """Initial slot should be zero."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
         bp = BlockProducer(simulator, config=config)
         assert bp.current_slot == 0
 
@@ -103,8 +142,6 @@ class TestSlotTicking:
         self, simulator: Simulator, config: SimulationConfig
     ) -> None:
         """Starting block producer schedules first slot tick."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
         bp.start()
@@ -116,38 +153,36 @@ class TestSlotTicking:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Slot number advances after each tick."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        create_node(simulator, network, config, "node-1")
+        create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
         bp.start()
+        slots_seen: list[int] = []
+        for tick in (1, 2):
+            simulator.run(until=tick * config.slot_duration + 0.1)
+            slots_seen.append(bp.current_slot)
 
-        simulator.run(until=config.slot_duration + 0.1)
-        assert bp.current_slot == 1
-
-        simulator.run(until=2 * config.slot_duration + 0.1)
-        assert bp.current_slot == 2
+        assert slots_seen == [1, 2]
 
     def test_tick_reschedules_next_tick(
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Each tick schedules the next tick."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        create_node(simulator, network, config, "node-1")
+        create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
         bp.start()
-        simulator.run(until=config.slot_duration + 0.1)
+        assert simulator.run_events(1) == 1  # The first tick
 
         assert simulator.pending_event_count() > 0
 
@@ -157,12 +192,11 @@ class TestProposerSelection:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Proposer selection rotates through registered nodes."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        nodes = [create_node(simulator, network, config, f"node-{i}") for i in range(3)]
+        nodes = [create_node(simulator, network, metrics, config, f"node-{i}") for i in range(3)]
 
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
@@ -180,29 +214,44 @@ class TestProposerSelection:
         # All slots should have ticked
         assert bp.current_slot == 3
 
+    def test_preview_proposers_round_robin(
+        self,
+        simulator: Simulator,
+        network: Network,
+        metrics: MetricsCollector,
+        config: SimulationConfig,
+    ) -> None:
+        """Upcoming proposers cycle through nodes in registration order."""
+        nodes = [create_node(simulator, network, metrics, config, f"node-{i}") for i in range(3)]
+        bp = BlockProducer(simulator, config=config)
+        simulator.register_actor(bp)
+
+        ids = [node.id for node in nodes]
+        assert bp.preview_proposers(4) == [*ids, ids[0]]
+        assert simulator.pending_event_count() == 0
+
 
 class TestBlobSelection:
     def test_selects_transactions_by_priority(
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Transactions are selected by effective tip (priority fee)."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        node = create_node(simulator, network, config, "node-1")
+        node = create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
         # Add txs with different tips
-        tx_low = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20, gas_tip_cap=100)
-        tx_high = create_blob_tx("0x" + "bb" * 32, "0x" + "22" * 20, gas_tip_cap=200)
+        tx_low = create_blob_tx(TX_HASH_A, SENDER_A, gas_tip_cap=100)
+        tx_high = create_blob_tx(TX_HASH_B, SENDER_B, gas_tip_cap=200)
         node.pool.add(tx_low)
         node.pool.add(tx_high)
 
         bp.start()
-        simulator.run(until=config.slot_duration + 3.0)  # Past cleanup
+        simulator.run(until=config.slot_duration + CLEANUP_DELAY + 0.05)  # Past cleanup
 
         # Both should have been included and cleaned up
         assert not node.pool.contains(tx_low.tx_hash)
@@ -212,25 +261,23 @@ class TestBlobSelection:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
+        sample_txs: list[BlobTxEntry],
     ) -> None:
         """Block producer respects max blobs per block limit."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
         # Create config with 2 max blobs
         limited_config = SimulationConfig(slot_duration=1.0, max_blobs_per_block=2)
 
-        node = create_node(simulator, network, limited_config, "node-1")
+        node = create_node(simulator, network, metrics, limited_config, "node-1")
         bp = BlockProducer(simulator, config=limited_config)
         simulator.register_actor(bp)
 
         # Add 5 single-blob transactions
-        for i in range(5):
-            tx = create_blob_tx(f"0x{i:064x}", f"0x{i:040x}", gas_tip_cap=100 + i)
-            node.pool.add(tx)
+        node.pool.add_many(sample_txs)
 
         bp.start()
-        simulator.run(until=limited_config.slot_duration + 3.0)
+        simulator.run(until=limited_config.slot_duration + CLEANUP_DELAY + 0.05)
 
         # Only 2 txs should be included per block (highest tips first)
         # After one block, 3 txs should remain
@@ -240,25 +287,24 @@ class TestBlobSelection:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Multi-blob transactions are counted correctly against limit."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
         limited_config = SimulationConfig(slot_duration=1.0, max_blobs_per_block=4)
 
-        node = create_node(simulator, network, limited_config, "node-1")
+        node = create_node(simulator, network, metrics, limited_config, "node-1")
         bp = BlockProducer(simulator, config=limited_config)
         simulator.register_actor(bp)
 
         # Add a 3-blob tx and a 2-blob tx (total 5 blobs, only 3-blob should fit)
-        tx_3blob = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20, gas_tip_cap=200, blob_count=3)
-        tx_2blob = create_blob_tx("0x" + "bb" * 32, "0x" + "22" * 20, gas_tip_cap=100, blob_count=2)
+        tx_3blob = create_blob_tx(TX_HASH_A, SENDER_A, gas_tip_cap=200, blob_count=3)
+        tx_2blob = create_blob_tx(TX_HASH_B, SENDER_B, gas_tip_cap=100, blob_count=2)
         node.pool.add(tx_3blob)
         node.pool.add(tx_2blob)
 
         bp.start()
-        simulator.run(until=limited_config.slot_duration + 3.0)
+        simulator.run(until=limited_config.slot_duration + CLEANUP_DELAY + 0.05)
 
         # Only 3-blob tx should fit (3 <= 4, but 3+2 > 4)
         assert not node.pool.contains(tx_3blob.tx_hash)
@@ -266,62 +312,39 @@ class TestBlobSelection:
 
 
 class TestInclusionPolicies:
-    def test_conservative_requires_full_availability(
-        self,
-        simulator: Simulator,
-        network: Network,
-        config: SimulationConfig,
-    ) -> None:
-        """Conservative policy only includes txs with full blob availability."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        conservative_config = SimulationConfig(
-            slot_duration=1.0, inclusion_policy=InclusionPolicy.CONSERVATIVE
-        )
-
-        node = create_node(simulator, network, conservative_config, "node-1")
-        bp = BlockProducer(simulator, config=conservative_config)
-        simulator.register_actor(bp)
-
-        # Add one full tx and one partial tx
-        tx_full = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20, cell_mask=ALL_ONES)
-        tx_partial = create_blob_tx("0x" + "bb" * 32, "0x" + "22" * 20, cell_mask=0xFF)
-        node.pool.add(tx_full)
-        node.pool.add(tx_partial)
-
-        bp.start()
-        simulator.run(until=conservative_config.slot_duration + 3.0)
-
-        # Only full tx should be included
-        assert not node.pool.contains(tx_full.tx_hash)
-        assert node.pool.contains(tx_partial.tx_hash)
-
-    def test_optimistic_includes_partial_availability(
+    @pytest.mark.parametrize(
+        ("policy", "cell_mask", "included"),
+        [
+            (InclusionPolicy.CONSERVATIVE, ALL_ONES, True),
+            (InclusionPolicy.CONSERVATIVE, 0xFF, False),
+            (InclusionPolicy.OPTIMISTIC, ALL_ONES, True),
+            (InclusionPolicy.OPTIMISTIC, 0xFF, True),
+        ],
+    )
+    def test_inclusion_by_availability(
         self,
         simulator: Simulator,
         network: Network,
-        config: SimulationConfig,
+        metrics: MetricsCollector,
+        policy: InclusionPolicy,
+        cell_mask: int,
+        included: bool,
     ) -> None:
-        """Optimistic policy includes txs with any availability."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        optimistic_config = SimulationConfig(
-            slot_duration=1.0, inclusion_policy=InclusionPolicy.OPTIMISTIC
-        )
+        """Conservative policy needs the full blob; optimistic includes any availability."""
+        policy_config = SimulationConfig(slot_duration=1.0, inclusion_policy=policy)
 
-        node = create_node(simulator, network, optimistic_config, "node-1")
-        bp = BlockProducer(simulator, config=optimistic_config)
+        node = create_node(simulator, network, metrics, policy_config, "node-1")
+        bp = BlockProducer(simulator, config=policy_config)
         simulator.register_actor(bp)
 
-        # Add partial availability tx
-        tx_partial = create_blob_tx("0x" + "bb" * 32, "0x" + "22" * 20, cell_mask=0xFF)
-        node.pool.add(tx_partial)
+        tx = create_blob_tx(TX_HASH_A, SENDER_A, cell_mask=cell_mask)
+        node.pool.add(tx)
 
         bp.start()
-        simulator.run(until=optimistic_config.slot_duration + 3.0)
+        simulator.run(until=policy_config.slot_duration + CLEANUP_DELAY + 0.05)
 
-        # Partial tx should be included
-        assert not node.pool.contains(tx_partial.tx_hash)
+        # Included txs are cleaned up from the pool after the block
+        assert node.pool.contains(tx.tx_hash) is not included
 
 
 class TestBlockBroadcast:
@@ -329,28 +352,21 @@ class TestBlockBroadcast:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Block announcement is broadcast to all registered nodes."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        nodes = [create_node(simulator, network, config, f"node-{i}") for i in range(3)]
-
-        # Connect all nodes as peers
-        for i, node in enumerate(nodes):
-            for j, other in enumerate(nodes):
-                if i != j:
-                    node.add_peer(other.id)
+        nodes = create_mesh(simulator, network, metrics, config, 3)
 
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
         # Add tx to first node (it will be proposer at slot 0)
-        tx = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20)
+        tx = create_blob_tx(TX_HASH_A, SENDER_A)
         nodes[0].pool.add(tx)
 
         bp.start()
-        simulator.run(until=config.slot_duration + 3.0)
+        simulator.run(until=config.slot_duration + CLEANUP_DELAY + 0.05)
 
         # Tx should be removed from proposer's pool after cleanup
         assert not nodes[0].pool.contains(tx.tx_hash)
@@ -359,12 +375,11 @@ class TestBlockBroadcast:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """No block is broadcast when there are no includable transactions."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        create_node(simulator, network, config, "node-1")
+        create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
@@ -379,24 +394,23 @@ class TestNodeBlockHandling:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Included transactions are removed from pool after cleanup delay."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        node = create_node(simulator, network, config, "node-1")
+        node = create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
-        tx = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20)
+        tx = create_blob_tx(TX_HASH_A, SENDER_A)
         node.pool.add(tx)
 
         assert node.pool.contains(tx.tx_hash)
 
         bp.start()
 
-        # Run past cleanup delay (2 seconds + network delay buffer)
-        simulator.run(until=config.slot_duration + 3.0)
+        # Run just past the cleanup delay
+        simulator.run(until=config.slot_duration + CLEANUP_DELAY + 0.05)
 
         # Now tx should be removed
         assert not node.pool.contains(tx.tx_hash)
@@ -405,30 +419,21 @@ class TestNodeBlockHandling:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Pending transactions are removed when block announces them."""
-        from sparse_blobpool.actors.block_producer import BlockProducer
-
-        node = create_node(simulator, network, config, "node-1")
-
-        # Create a second node that will have a pending tx
-        node2 = create_node(simulator, network, config, "node-2")
-
-        # Connect nodes as peers
-        node.add_peer(node2.id)
-        node2.add_peer(node.id)
+        # The second node will have a pending tx
+        node, node2 = create_mesh(simulator, network, metrics, config, 2)
 
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
         # Add tx to first node's pool
-        tx = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20)
+        tx = create_blob_tx(TX_HASH_A, SENDER_A)
         node.pool.add(tx)
 
         # Manually add same tx as pending on node2
-        from sparse_blobpool.actors.honest import PendingTx, Role, TxState
-
         pending = PendingTx(
             tx_hash=tx.tx_hash,
             role=Role.PROVIDER,
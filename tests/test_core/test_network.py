@@ -111,6 +111,43 @@ class TestNetwork:
         assert len(receiver.received) == 1
         assert receiver.received[0][1].content == "hello"  # type: ignore[union-attr]
 
+    def test_send_many_matches_individual_sends(self) -> None:
+        """Batched delivery produces the same arrivals and stats as one send per peer."""
+        receiver_ids = [ActorId(f"receiver-{i}") for i in range(3)]
+        countries = ["germany", "japan", "united states"]
+
+        def deliver(batched: bool) -> tuple[list[float], Network]:
+            sim = Simulator(seed=7)
+            network = make_network(sim)
+            sim._network = network
+
+            sender = RecordingActor(ActorId("sender"), sim)
+            sim.register_actor(sender)
+            network.register_node(sender.id, "germany")
+            receivers = []
+            for receiver_id, country in zip(receiver_ids, countries, strict=True):
+                receiver = RecordingActor(receiver_id, sim)
+                sim.register_actor(receiver)
+                network.register_node(receiver_id, country)
+                receivers.append(receiver)
+
+            msg = SampleMessage(sender=sender.id, content="hello")
+            if batched:
+                sender.send_many(msg, receiver_ids)
+            else:
+                for receiver_id in receiver_ids:
+                    sender.send(msg, to=receiver_id)
+            sim.run_until_empty()
+
+            return [receiver.received[0][0] for receiver in receivers], network
+
+        individual_arrivals, individual_network = deliver(batched=False)
+        batched_arrivals, batched_network = deliver(batched=True)
+
+        assert batched_arrivals == individual_arrivals
+        assert batched_network.messages_delivered == individual_network.messages_delivered == 3
+        assert batched_network.total_bytes == individual_network.total_bytes == 300
+
     def test_message_delivery_has_latency(self) -> None:
         """Message delivery takes time based on latency model."""
         sim = Simulator()
@@ -267,6 +304,22 @@ class TestNetwork:
         # Should still work with default country
         assert len(receiver.received) == 1
 
+    def test_latency_tables_match_model(self) -> None:
+        """Precomputed country-pair tables agree with the latency model."""
+        sim = Simulator()
+        network = make_network(sim)
+        countries = ["germany", "japan", "united states", "germany"]
+        for i, country in enumerate(countries):
+            network.register_node(ActorId(f"node-{i}"), country)
+
+        for from_country, i in network._country_index.items():
+            for to_country, j in network._country_index.items():
+                params = LATENCY_MODEL.get_latency(from_country, to_country)
+                base = params.base_ms / 1000.0
+                assert network._base_delay[i][j] == base
+                assert network._jitter_stddev[i][j] == base * params.jitter_ratio
+        assert len(network._country_index) == 3
+
 
 class TestCoDelState:
     def test_default_values(self) -> None:
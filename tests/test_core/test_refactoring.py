@@ -46,12 +46,12 @@ def network(simulator: Simulator, metrics: MetricsCollector) -> Network:
 def create_node(
     simulator: Simulator,
     network: Network,
+    metrics: MetricsCollector,
     config: SimulationConfig,
     node_id: str,
     country: str = "united states",
 ) -> Node:
-    """Helper to create and register a node."""
-    metrics = MetricsCollector(simulator=simulator)
+    """Helper to create and register a node recording into the shared metrics collector."""
     node = Node(ActorId(node_id), simulator, config, custody_columns=8, metrics=metrics)
     simulator.register_actor(node)
     network.register_node(node.id, country)
@@ -87,12 +87,13 @@ class TestUnifiedNodes:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Simulator.nodes should return Node actors from _actors dict."""
         # Create some nodes
-        node1 = create_node(simulator, network, config, "node-1")
-        node2 = create_node(simulator, network, config, "node-2")
+        node1 = create_node(simulator, network, metrics, config, "node-1")
+        node2 = create_node(simulator, network, metrics, config, "node-2")
 
         # The nodes property should return these from _actors
         nodes = simulator.nodes
@@ -104,13 +105,14 @@ class TestUnifiedNodes:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Simulator.nodes should not include non-Node actors."""
         from sparse_blobpool.actors.block_producer import BlockProducer
 
         # Create a node and a block producer
-        node = create_node(simulator, network, config, "node-1")
+        node = create_node(simulator, network, metrics, config, "node-1")
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
 
@@ -144,12 +146,13 @@ class TestProduceBlockMessage:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Node should handle ProduceBlock command and produce a block."""
         from sparse_blobpool.protocol.commands import ProduceBlock
 
-        node = create_node(simulator, network, config, "node-1")
+        node = create_node(simulator, network, metrics, config, "node-1")
 
         # Add a transaction to the pool
         tx = create_blob_tx("0x" + "aa" * 32, "0x" + "11" * 20)
@@ -168,14 +171,15 @@ class TestProduceBlockMessage:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """Node producing a block should broadcast to all peers."""
         from sparse_blobpool.protocol.commands import ProduceBlock
 
-        node1 = create_node(simulator, network, config, "node-1")
-        node2 = create_node(simulator, network, config, "node-2")
-        node3 = create_node(simulator, network, config, "node-3")
+        node1 = create_node(simulator, network, metrics, config, "node-1")
+        node2 = create_node(simulator, network, metrics, config, "node-2")
+        node3 = create_node(simulator, network, metrics, config, "node-3")
 
         # Set up peer connections
         node1.add_peer(node2.id)
@@ -214,12 +218,13 @@ class TestBlockProducerAsTimer:
         self,
         simulator: Simulator,
         network: Network,
+        metrics: MetricsCollector,
         config: SimulationConfig,
     ) -> None:
         """BlockProducer should send ProduceBlock message to selected node."""
         from sparse_blobpool.actors.block_producer import BlockProducer
 
-        node = create_node(simulator, network, config, "node-1")
+        node = create_node(simulator, network, metrics, config, "node-1")
 
         bp = BlockProducer(simulator, config=config)
         simulator.register_actor(bp)
@@ -31,59 +31,36 @@ class RecordingActor(Actor):
         self.events.append(payload)
 
 
-class TestEvent:
-    def test_event_ordering_by_timestamp(self) -> None:
-        """Events are ordered by timestamp first."""
-        e1 = Event(
-            timestamp=1.0,
-            priority=0,
-            target_id=ActorId("a"),
-            payload=DummyCommand(),
-        )
-        e2 = Event(
-            timestamp=2.0,
-            priority=0,
-            target_id=ActorId("a"),
-            payload=DummyCommand(),
-        )
-
-        assert e1 < e2
+class TestEventOrdering:
+    def test_same_timestamp_ordered_by_priority(self) -> None:
+        """Events with the same timestamp run lower priority values first."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("a"), sim)
+        sim.register_actor(actor)
 
-    def test_event_ordering_by_priority(self) -> None:
-        """Events with same timestamp are ordered by priority (lower first)."""
-        e1 = Event(
-            timestamp=1.0,
-            priority=0,
-            target_id=ActorId("a"),
-            payload=DummyCommand(),
+        sim.schedule(
+            Event(timestamp=1.0, priority=1, target_id=ActorId("a"), payload=DummyCommand(order=1))
         )
-        e2 = Event(
-            timestamp=1.0,
-            priority=1,
-            target_id=ActorId("a"),
-            payload=DummyCommand(),
+        sim.schedule(
+            Event(timestamp=1.0, priority=0, target_id=ActorId("a"), payload=DummyCommand(order=0))
         )
+        sim.run_until_empty()
 
-        assert e1 < e2
+        assert [e.order for e in actor.events] == [0, 1]  # type: ignore[union-attr]
 
-    def test_event_equality(self) -> None:
-        """Events with same timestamp and priority are equal for ordering."""
-        e1 = Event(
-            timestamp=1.0,
-            priority=0,
-            target_id=ActorId("a"),
-            payload=DummyCommand(),
-        )
-        e2 = Event(
-            timestamp=1.0,
-            priority=0,
-            target_id=ActorId("b"),
-            payload=DummyCommand(order=99),
-        )
+    def test_ties_run_in_schedule_order(self) -> None:
+        """Events with the same timestamp and priority run in the order scheduled."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("a"), sim)
+        sim.register_actor(actor)
+
+        for order in range(5):
+            sim.schedule(
+                Event(timestamp=1.0, target_id=ActorId("a"), payload=DummyCommand(order=order))
+            )
+        sim.run_until_empty()
 
-        # They compare equal because target_id and payload are not compared
-        assert not (e1 < e2)
-        assert not (e2 < e1)
+        assert [e.order for e in actor.events] == list(range(5))  # type: ignore[union-attr]
 
 
 class TestSimulator:
@@ -147,6 +124,157 @@ class TestSimulator:
                 )
             )
 
+    def test_schedule_many_preserves_order(self) -> None:
+        """Batched events interleave with queued ones and keep FIFO order on ties."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        sim.schedule(Event(timestamp=2.0, target_id=ActorId("test"), payload=DummyCommand(order=0)))
+        sim.schedule_many(
+            Event(timestamp=t, target_id=ActorId("test"), payload=DummyCommand(order=order))
+            for order, t in [(1, 1.0), (2, 2.0), (3, 1.0)]
+        )
+        sim.run_until_empty()
+
+        assert [e.order for e in actor.events] == [1, 3, 0, 2]  # type: ignore[union-attr]
+
+    def test_schedule_many_small_batch_into_long_queue(self) -> None:
+        """A batch much smaller than the queue is merged in timestamp order."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        for order in range(20):
+            sim.schedule(
+                Event(
+                    timestamp=float(order),
+                    target_id=ActorId("test"),
+                    payload=DummyCommand(order=order),
+                )
+            )
+        sim.schedule_many(
+            [
+                Event(timestamp=4.5, target_id=ActorId("test"), payload=DummyCommand(order=100)),
+                Event(timestamp=0.0, target_id=ActorId("test"), payload=DummyCommand(order=101)),
+            ]
+        )
+        sim.run_until_empty()
+
+        orders = [e.order for e in actor.events]  # type: ignore[union-attr]
+        assert orders[:2] == [0, 101]
+        assert orders[5:7] == [4, 100]
+        assert len(orders) == 22
+
+    def test_schedule_many_past_event_raises(self) -> None:
+        """A batch containing a past event is rejected without queueing anything."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+        sim.schedule(Event(timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand()))
+        sim.run(until=2.0)
+
+        with pytest.raises(ValueError, match="past"):
+            sim.schedule_many(
+                [
+                    Event(timestamp=3.0, target_id=ActorId("test"), payload=DummyCommand()),
+                    Event(timestamp=0.5, target_id=ActorId("test"), payload=DummyCommand()),
+                ]
+            )
+        assert sim.pending_event_count() == 0
+
+    def test_canceled_event_is_skipped(self) -> None:
+        """A canceled event is never dispatched and no longer counts as pending."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        kept = Event(timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand(order=1))
+        dropped = Event(timestamp=2.0, target_id=ActorId("test"), payload=DummyCommand(order=2))
+        sim.schedule(kept)
+        sim.schedule(dropped)
+        sim.schedule(Event(timestamp=3.0, target_id=ActorId("test"), payload=DummyCommand(order=3)))
+
+        sim.cancel(dropped)
+        sim.cancel(dropped)  # Canceling twice is a no-op
+        assert sim.pending_event_count() == 2
+
+        sim.run_until_empty()
+
+        assert [e.order for e in actor.events] == [1, 3]  # type: ignore[union-attr]
+        assert sim.events_processed == 2
+        assert sim.pending_event_count() == 0
+
+    def test_cancel_after_fire_is_noop(self) -> None:
+        """Canceling an event that already fired leaves the pending count alone."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        fired = Event(timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand())
+        sim.schedule(fired)
+        sim.run_events(1)
+        for t in (2.0, 3.0, 4.0):
+            sim.schedule(Event(timestamp=t, target_id=ActorId("test"), payload=DummyCommand()))
+
+        sim.cancel(fired)
+
+        assert not fired.canceled
+        assert sim.pending_event_count() == 3
+
+    def test_canceled_is_not_an_init_field(self) -> None:
+        """Events can only be canceled through the simulator."""
+        with pytest.raises(TypeError):
+            Event(  # type: ignore[call-arg]
+                timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand(), canceled=True
+            )
+
+    def test_cancel_compacts_mostly_canceled_queue(self) -> None:
+        """Once most queued events are canceled, the queue is rebuilt without them."""
+        sim = Simulator()
+        events = [
+            Event(timestamp=float(t), target_id=ActorId("test"), payload=DummyCommand())
+            for t in range(1, 5)
+        ]
+        for event in events:
+            sim.schedule(event)
+
+        sim.cancel(events[0])
+        sim.cancel(events[1])
+        assert len(sim._event_queue) == 4
+
+        sim.cancel(events[2])
+        assert len(sim._event_queue) == 1
+        assert sim.pending_event_count() == 1
+
+    def test_zero_delay_command_keeps_order_among_same_time_events(self) -> None:
+        """A command scheduled for the current instant runs after earlier-queued ties."""
+        sim = Simulator()
+
+        class ChainingActor(RecordingActor):
+            def on_event(self, payload: EventPayload) -> None:
+                super().on_event(payload)
+                if isinstance(payload, DummyCommand) and payload.order == 0:
+                    self.schedule_command(0.0, DummyCommand(order=2))
+
+        actor = ChainingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        sim.schedule(Event(timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand(order=0)))
+        sim.schedule(Event(timestamp=1.0, target_id=ActorId("test"), payload=DummyCommand(order=1)))
+        sim.schedule(
+            Event(
+                timestamp=1.0,
+                priority=-1,
+                target_id=ActorId("test"),
+                payload=DummyCommand(order=-1),
+            )
+        )
+        sim.run(until=5.0)
+
+        assert [e.order for e in actor.events] == [-1, 0, 1, 2]  # type: ignore[union-attr]
+        assert sim.pending_event_count() == 0
+
     def test_run_processes_events_in_order(self) -> None:
         """Events are processed in timestamp order."""
         sim = Simulator()
@@ -235,6 +363,27 @@ class TestSimulator:
         assert sim.current_time == 200.0
         assert sim.pending_event_count() == 0
 
+    def test_run_events_processes_exact_count(self) -> None:
+        """run_events stops after count live events, skipping canceled ones."""
+        sim = Simulator()
+        actor = RecordingActor(ActorId("test"), sim)
+        sim.register_actor(actor)
+
+        events = [
+            Event(timestamp=float(t), target_id=ActorId("test"), payload=DummyCommand(order=t))
+            for t in range(5)
+        ]
+        for event in events:
+            sim.schedule(event)
+        sim.cancel(events[1])
+
+        assert sim.run_events(2) == 2
+        assert [e.order for e in actor.events] == [0, 2]  # type: ignore[union-attr]
+        assert sim.current_time == 2.0
+
+        assert sim.run_events(10) == 2
+        assert sim.pending_event_count() == 0
+
     def test_deterministic_with_seed(self) -> None:
         """Simulator RNG is deterministic with the same seed."""
         sim1 = Simulator(seed=12345)
@@ -285,6 +434,29 @@ class TestSimulator:
         assert len(type_b_actors) == 1
         assert all(isinstance(a, TypeA) for a in type_a_actors)
         assert all(isinstance(b, TypeB) for b in type_b_actors)
+        # Base classes match subclass instances, in registration order
+        assert sim.actors_by_type(Actor) == [a1, a2, b1]
+
+    def test_broadcast_transactions_delivers_one_tx_per_origin(self) -> None:
+        """broadcast_transactions schedules one BroadcastTransaction per origin, in order."""
+        from sparse_blobpool.protocol.commands import BroadcastTransaction
+
+        sim = Simulator()
+        a = RecordingActor(ActorId("a"), sim)
+        b = RecordingActor(ActorId("b"), sim)
+        sim.register_actor(a)
+        sim.register_actor(b)
+
+        tx_hashes = sim.broadcast_transactions([a, b, a])  # type: ignore[list-item]
+
+        assert len(set(tx_hashes)) == 3
+        assert sim.pending_event_count() == 3
+
+        sim.run_until_empty()
+
+        assert all(isinstance(e, BroadcastTransaction) for e in a.events + b.events)
+        assert [e.tx_hash for e in a.events] == [tx_hashes[0], tx_hashes[2]]
+        assert [e.tx_hash for e in b.events] == [tx_hashes[1]]
 
 
 class TestActorCommandScheduling:
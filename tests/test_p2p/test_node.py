@@ -125,7 +125,7 @@ class TestCustodyMask:
         """Custody mask should have exactly custody_columns bits set."""
         node = make_node(ActorId("test-node"), simulator, config)
 
-        bit_count = bin(node._custody_mask).count("1")
+        bit_count = node._custody_mask.bit_count()
         assert bit_count == 8
 
     def test_custody_mask_is_deterministic(
@@ -442,6 +442,38 @@ class TestResponseHandling:
         assert tx_hash not in node._pending_txs
         assert node.pool.contains(tx_hash)
 
+    def test_cells_response_cancels_request_timeout(
+        self, node: Node, simulator: Simulator, network: Network
+    ) -> None:
+        """Answering a cell request cancels its pending timeout."""
+        peer = ActorId("peer-1")
+        node.add_peer(peer)
+
+        tx_hash = TxHash("0x" + "ab" * 32)
+
+        from sparse_blobpool.actors.honest import PendingTx
+
+        pending = PendingTx(
+            tx_hash=tx_hash,
+            role=Role.PROVIDER,
+            state=TxState.FETCHING_TX,
+            first_seen=0.0,
+        )
+        pending.tx_body_received = True
+        node._pending_txs[tx_hash] = pending
+        node._request_all_cells(tx_hash, peer)
+
+        assert pending.pending_request_id is not None
+        timeout = node._pending_requests[pending.pending_request_id].timeout
+        assert timeout is not None and not timeout.canceled
+
+        node.on_event(
+            Cells(sender=peer, tx_hashes=[tx_hash], cells=[[None] * 128], cell_mask=ALL_ONES)
+        )
+
+        assert timeout.canceled
+        assert not node._pending_requests
+
     def test_cells_response_completes_sampler(
         self, node: Node, simulator: Simulator, network: Network
     ) -> None:
@@ -584,6 +616,12 @@ class TestPeerManagement:
         node.add_peer(peer)
         assert peer in node.peers
 
+    def test_add_peers(self, node: Node) -> None:
+        """Can add several peers at once, ignoring duplicates."""
+        peers = [ActorId("peer-1"), ActorId("peer-2"), ActorId("peer-1")]
+        node.add_peers(peers)
+        assert node.peers == {ActorId("peer-1"), ActorId("peer-2")}
+
     def test_remove_peer(self, node: Node) -> None:
         """Can remove peers from node."""
         peer = ActorId("peer-1")
@@ -591,6 +629,17 @@ class TestPeerManagement:
         node.remove_peer(peer)
         assert peer not in node.peers
 
+    def test_sorted_peers_follows_membership_changes(self, node: Node) -> None:
+        """The cached fan-out order is refreshed after every peer change."""
+        node.add_peers([ActorId("peer-3"), ActorId("peer-1")])
+        assert node._sorted_peers() == (ActorId("peer-1"), ActorId("peer-3"))
+
+        node.add_peer(ActorId("peer-2"))
+        assert node._sorted_peers() == (ActorId("peer-1"), ActorId("peer-2"), ActorId("peer-3"))
+
+        node.remove_peer(ActorId("peer-1"))
+        assert node._sorted_peers() == (ActorId("peer-2"), ActorId("peer-3"))
+
     def test_remove_nonexistent_peer_is_safe(self, node: Node) -> None:
         """Removing non-existent peer doesn't raise."""
         peer = ActorId("nonexistent")
@@ -156,6 +156,6 @@ class TestCustodyMask:
         node = make_node(ActorId(f"node_{seed}"), sim, config, custody_columns=columns)
 
         # Count bits set in mask
-        bit_count = bin(node._custody_mask).count("1")
+        bit_count = node._custody_mask.bit_count()
 
         assert bit_count == columns
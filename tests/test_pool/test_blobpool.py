@@ -126,6 +126,55 @@ class TestBlobpoolBasic:
         assert pool.tx_count == 1
         assert pool.contains(entries[1].tx_hash)
 
+    def test_add_many(self, pool: Blobpool) -> None:
+        entries = [make_tx_entry(tx_hash=f"0x{i}", nonce=i) for i in range(3)]
+
+        results = pool.add_many(entries)
+        assert [r.added for r in results] == [True, True, True]
+        assert pool.tx_count == 3
+        assert pool.size_bytes == 1500
+
+    def test_add_many_matches_sequential_adds(self, config: SimulationConfig) -> None:
+        def batch() -> list[BlobTxEntry]:
+            return [
+                make_tx_entry(tx_hash="0x0", sender="0xs0", gas_tip_cap=100),
+                make_tx_entry(tx_hash="0x1", sender="0xs1", gas_tip_cap=200),
+                make_tx_entry(tx_hash="0x2", sender="0xs2", gas_tip_cap=100),
+                # Replaces 0x0 within the same batch
+                make_tx_entry(tx_hash="0x3", sender="0xs0", gas_fee_cap=2000, gas_tip_cap=200),
+            ]
+
+        sequential = Blobpool(config)
+        for entry in batch():
+            sequential.add(entry)
+        batched = Blobpool(config)
+        batched.add_many(batch())
+
+        expected = [e.tx_hash for e in sequential.iter_top()]
+        assert [e.tx_hash for e in batched.iter_top()] == expected
+        assert expected == [TxHash("0x1"), TxHash("0x3"), TxHash("0x2")]
+
+    def test_add_many_counts_only_pushed_slots_as_stale(self, pool: Blobpool) -> None:
+        pool.add_many(
+            [
+                make_tx_entry(tx_hash="0x0", nonce=0),
+                make_tx_entry(tx_hash="0x1", nonce=0, gas_fee_cap=2000, gas_tip_cap=200),
+            ]
+        )
+
+        assert pool._stale_count == 0
+        assert len(pool._priority_heap) == 1
+
+    def test_add_many_keeps_entries_before_rejection(self, pool: Blobpool) -> None:
+        entries = [
+            make_tx_entry(tx_hash="0x0", nonce=0),
+            make_tx_entry(tx_hash="0x1", nonce=0),  # Same nonce, no fee bump
+        ]
+
+        with pytest.raises(RBFRejected):
+            pool.add_many(entries)
+        assert [e.tx_hash for e in pool.iter_top()] == [TxHash("0x0")]
+
     def test_clear(self, pool: Blobpool) -> None:
         for i in range(3):
             pool.add(make_tx_entry(tx_hash=f"0x{i}", nonce=i))
@@ -370,6 +419,39 @@ class TestIteration:
             TxHash("0x1"),
         ]
 
+    def test_iter_top_matches_sorted_order(self, pool: Blobpool) -> None:
+        tips = [100, 300, 200, 300, 100, 200]
+        for i, tip in enumerate(tips):
+            pool.add(make_tx_entry(tx_hash=f"0x{i}", sender=f"0xs{i}", gas_tip_cap=tip))
+        pool.remove(TxHash("0x1"))
+        pool.remove(TxHash("0x2"))
+        pool.add(make_tx_entry(tx_hash="0x1", sender="0xs1", gas_tip_cap=200))
+
+        expected = sorted(pool._txs.values(), key=lambda e: e.effective_tip, reverse=True)
+        assert list(pool.iter_top()) == expected
+        assert list(pool.iter_top(2)) == expected[:2]
+
+    def test_iter_top_after_remove_and_readd(self, pool: Blobpool) -> None:
+        entries = [
+            make_tx_entry(tx_hash=f"0x{i}", sender=f"0xs{i}", gas_tip_cap=i) for i in range(5)
+        ]
+        for entry in entries:
+            pool.add(entry)
+        pool.remove(TxHash("0x3"))
+        pool.add(entries[3])
+
+        expected = [TxHash(f"0x{i}") for i in reversed(range(5))]
+        assert [e.tx_hash for e in pool.iter_top(5)] == expected
+        assert [e.tx_hash for e in pool.iter_by_priority()] == expected
+
+    def test_iter_top_compacts_removed_entries(self, pool: Blobpool) -> None:
+        for i in range(4):
+            pool.add(make_tx_entry(tx_hash=f"0x{i}", sender=f"0xs{i}", gas_tip_cap=i))
+        pool.remove_batch([TxHash("0x0"), TxHash("0x1"), TxHash("0x2")])
+
+        assert len(pool._priority_heap) == 1
+        assert [e.tx_hash for e in pool.iter_top()] == [TxHash("0x3")]
+
     def test_iter_expired(self, pool: Blobpool) -> None:
         entries = [
             make_tx_entry(tx_hash="0x1", sender="0xs1", received_at=0.0),
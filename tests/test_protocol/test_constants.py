@@ -6,6 +6,7 @@ from sparse_blobpool.protocol.constants import (
     CELLS_PER_BLOB,
     MAX_BLOBS_PER_TX,
     RECONSTRUCTION_THRESHOLD,
+    columns_to_mask,
 )
 
 
@@ -31,7 +32,7 @@ class TestCellConstants:
 class TestCellMaskConstants:
     def test_all_ones_has_128_bits_set(self) -> None:
         """ALL_ONES should have exactly CELLS_PER_BLOB bits set."""
-        assert bin(ALL_ONES).count("1") == CELLS_PER_BLOB
+        assert ALL_ONES.bit_count() == CELLS_PER_BLOB
 
     def test_all_ones_is_uint128_max_for_128_columns(self) -> None:
         """ALL_ONES should be (2^128 - 1)."""
@@ -40,3 +41,9 @@ class TestCellMaskConstants:
     def test_all_ones_fits_in_16_bytes(self) -> None:
         """ALL_ONES should fit in uint128 (16 bytes)."""
         assert ALL_ONES.bit_length() <= 128
+
+    def test_columns_to_mask(self) -> None:
+        """Each column sets one bit; repeats are harmless."""
+        assert columns_to_mask([0, 3, 3, 127]) == 0b1001 | (1 << 127)
+        assert columns_to_mask(range(CELLS_PER_BLOB)) == ALL_ONES
+        assert columns_to_mask([]) == 0
@@ -1,16 +1,21 @@
 """Tests for attack scenarios."""
 
+from random import Random
+
 from sparse_blobpool.actors.adversaries.victim_selection import VictimSelectionConfig
 from sparse_blobpool.config import SimulationConfig
+from sparse_blobpool.core.types import ActorId
 from sparse_blobpool.scenarios import (
     PoisoningScenarioConfig,
     SpamScenarioConfig,
     WithholdingScenarioConfig,
     run_poisoning_scenario,
     run_spam_scenario,
+    run_spam_sweep,
     run_withholding_scenario,
 )
 from sparse_blobpool.scenarios.attacks.poisoning import TargetedPoisoningAdversary
+from sparse_blobpool.scenarios.attacks.selection import select_attacker_nodes
 from sparse_blobpool.scenarios.attacks.spam import SpamAdversary
 from sparse_blobpool.scenarios.attacks.withholding import WithholdingAdversary
 
@@ -98,13 +103,32 @@ class TestSpamScenario:
         assert adversary._spam_config.victim_selection_config is victim_config
 
 
+class TestSpamSweep:
+    def test_matches_sequential_runs(self) -> None:
+        attack_config = SpamScenarioConfig(spam_rate=5.0)
+        runs = [
+            (SimulationConfig(node_count=10, duration=1.0, seed=seed), attack_config)
+            for seed in (1, 2)
+        ]
+
+        results = run_spam_sweep(runs, num_transactions=2, run_duration=0.5, max_workers=2)
+
+        expected = [
+            run_spam_scenario(
+                config=config,
+                attack_config=attack_config,
+                num_transactions=2,
+                run_duration=0.5,
+            ).finalize_metrics()
+            for config, _ in runs
+        ]
+        assert results == expected
+
+
 class TestWithholdingScenario:
     def test_creates_withholding_adversary(self) -> None:
         config = SimulationConfig(node_count=10, duration=1.0)
-        attack_config = WithholdingScenarioConfig(
-            columns_to_serve=frozenset(range(32)),
-            num_attacker_nodes=3,
-        )
+        attack_config = WithholdingScenarioConfig.from_columns(range(32), num_attacker_nodes=3)
 
         sim = run_withholding_scenario(
             config=config,
@@ -132,9 +156,7 @@ class TestWithholdingScenario:
 
     def test_partial_column_serving(self) -> None:
         config = SimulationConfig(node_count=10, duration=1.0)
-        attack_config = WithholdingScenarioConfig(
-            columns_to_serve=frozenset(range(16)),
-        )
+        attack_config = WithholdingScenarioConfig(columns_to_serve_mask=(1 << 16) - 1)
 
         sim = run_withholding_scenario(
             config=config,
@@ -145,7 +167,7 @@ class TestWithholdingScenario:
 
         adversary = sim.actors_by_type(WithholdingAdversary)[0]
         withheld = adversary.get_withheld_columns(0xFFFFFFFFFFFFFFFF)
-        assert len(withheld) == 48
+        assert withheld.bit_count() == 48
 
     def test_attacker_node_count(self) -> None:
         config = SimulationConfig(node_count=20, duration=1.0)
@@ -252,3 +274,13 @@ class TestPoisoningScenario:
         adversary = sim.actors_by_type(TargetedPoisoningAdversary)[0]
         assert len(adversary.victims) == 3
         assert len(set(adversary.victims)) == 3
+
+
+class TestAttackerSelection:
+    def test_selecting_every_node_returns_a_copy(self) -> None:
+        all_node_ids = [ActorId(f"node-{i}") for i in range(3)]
+
+        selected = select_attacker_nodes(Random(0), all_node_ids, 5)
+
+        assert selected == all_node_ids
+        assert selected is not all_node_ids